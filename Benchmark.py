@@ -0,0 +1,98 @@
+'''
+ * Nombre: Benchmark.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Programa para medir el almacenamiento de store files con cada codec de compresión.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+import json
+import os
+import random
+import tempfile
+import time
+from prettytable import PrettyTable
+from StoreFile import writeStoreFile, StoreFileReader, CODECS, DEFAULT_BLOCK_SIZE
+
+#Configuración
+inputFile = "tables/schedules.json"
+blockSize = DEFAULT_BLOCK_SIZE
+numGets = 500
+repetitions = 5
+seed = 288
+
+"""
+Función para medir el mejor tiempo de varias repeticiones
+* function: Función a medir
+"""
+def bestTime(function):
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+"""
+Función para escribir un store file, reemplazando el de la repetición anterior
+* filePath: Ruta del store file
+* rows: Filas de la column family
+* codec: Codec de compresión
+"""
+def writeFamily(filePath, rows, codec):
+    if os.path.exists(filePath):
+        os.remove(filePath)
+    writeStoreFile(filePath, rows, blockSize, codec)
+
+"""
+Función para leer todas las filas de un store file sin caché, decodificando cada bloque
+* filePath: Ruta del store file
+"""
+def fullScan(filePath):
+    with StoreFileReader(filePath) as reader:
+        for _ in reader.scan():
+            pass
+
+"""
+Función para leer filas aleatorias de un store file sin caché
+* filePath: Ruta del store file
+* rowKeys: Row keys a buscar
+"""
+def randomGets(filePath, rowKeys):
+    with StoreFileReader(filePath) as reader:
+        for rowKey in rowKeys:
+            reader.getRow(rowKey)
+
+if __name__ == '__main__':
+    with open(inputFile, 'r') as f:
+        data = json.load(f)
+
+    random.seed(seed)
+    rowKeys = random.sample(sorted(data["rows_data"]), min(numGets, len(data["rows_data"])))
+
+    results = PrettyTable()
+    results.field_names = ["Family", "Codec", "Bytes", "Ratio", "Write (ms)", "Full scan (ms)", f"{numGets} gets (ms)"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for cf in data["metadata"]["column_families"]:
+            familyRows = {rowKey: rowData[cf] for rowKey, rowData in data["rows_data"].items() if cf in rowData}
+
+            for codec in CODECS:
+                filePath = os.path.join(directory, f"{cf}.{codec}.store")
+                writeTime = bestTime(lambda: writeFamily(filePath, familyRows, codec))
+
+                with StoreFileReader(filePath) as reader:
+                    rawBytes, storedBytes = reader.sizes()
+
+                scanTime = bestTime(lambda: fullScan(filePath))
+                getTime = bestTime(lambda: randomGets(filePath, rowKeys))
+
+                results.add_row([cf, codec, os.path.getsize(filePath), f"{rawBytes / storedBytes:.2f}x",
+                                 f"{writeTime * 1000:.1f}", f"{scanTime * 1000:.1f}", f"{getTime * 1000:.1f}"])
+
+    print(results)
@@ -0,0 +1,162 @@
+'''
+ * Nombre: BlockCache.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Caché de bloques decodificados compartida por todas las tablas del simulador de HBase.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+import sys
+import threading
+from collections import OrderedDict
+
+"""
+Función para estimar los bytes que ocupa en memoria un bloque decodificado, que son varias veces
+los bytes del JSON en disco
+* value: Bloque decodificado (diccionarios, listas y strings de JSON)
+"""
+def decodedSize(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + decodedSize(item)
+    elif isinstance(value, list):
+        for item in value:
+            size += decodedSize(item)
+    return size
+
+class BlockCache:
+    """
+    Constructor de la caché de bloques
+    * maxBytes: Presupuesto global de bytes para todos los bloques en caché
+    * singleAccessRatio: Fracción del presupuesto reservada para bloques accedidos una sola vez
+    """
+    def __init__(self, maxBytes=64 * 1024 * 1024, singleAccessRatio=0.25):
+        self.maxBytes = maxBytes
+        self.singleMaxBytes = int(maxBytes * singleAccessRatio)
+        self.multiMaxBytes = maxBytes - self.singleMaxBytes
+
+        #Segmentos LRU: bloques accedidos una vez y bloques accedidos varias veces
+        #Cada entrada es key -> (stamp, block, size). Los bloques se comparten entre todos los lectores,
+        #por lo que son de solo lectura: quien necesite modificarlos debe copiarlos
+        self.single = OrderedDict()
+        self.multi = OrderedDict()
+        self.singleBytes = 0
+        self.multiBytes = 0
+
+        #Estadísticas por tabla: tableName -> [hits, misses]
+        self.stats = {}
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    """
+    Función para obtener un bloque de la caché
+    * key: Llave del bloque (archivo, offset)
+    * stamp: Sello de validez del archivo, si no coincide el bloque se descarta
+    """
+    def getBlock(self, key, stamp):
+        with self.lock:
+            if key in self.multi:
+                entryStamp, block, size = self.multi[key]
+                if entryStamp == stamp:
+                    self.multi.move_to_end(key)
+                    return block
+                del self.multi[key]
+                self.multiBytes -= size
+                return None
+
+            if key in self.single:
+                entryStamp, block, size = self.single.pop(key)
+                self.singleBytes -= size
+                if entryStamp != stamp:
+                    return None
+
+                #Segundo acceso: el bloque se promueve al segmento de múltiples accesos
+                self.multi[key] = (entryStamp, block, size)
+                self.multiBytes += size
+                self._evict()
+                return block
+
+        return None
+
+    """
+    Función para guardar un bloque decodificado en la caché
+    * key: Llave del bloque (archivo, offset)
+    * stamp: Sello de validez del archivo
+    * block: Bloque decodificado
+    * size: Tamaño aproximado del bloque en bytes
+    """
+    def cacheBlock(self, key, stamp, block, size):
+        #Un bloque más grande que su segmento solo desplazaría al resto de la caché
+        if size > self.singleMaxBytes:
+            return
+
+        with self.lock:
+            if key in self.multi:
+                self.multiBytes -= self.multi.pop(key)[2]
+            if key in self.single:
+                self.singleBytes -= self.single.pop(key)[2]
+
+            self.single[key] = (stamp, block, size)
+            self.singleBytes += size
+            self._evict()
+
+    """
+    Función para descartar todos los bloques de un archivo
+    * filePath: Ruta del archivo cuyos bloques se descartan
+    """
+    def evictFile(self, filePath):
+        with self.lock:
+            for segment in (self.single, self.multi):
+                for key in [key for key in segment if key[0] == filePath]:
+                    size = segment.pop(key)[2]
+                    if segment is self.single:
+                        self.singleBytes -= size
+                    else:
+                        self.multiBytes -= size
+
+    """
+    Función para registrar un acierto o fallo de la caché para una tabla
+    * tableName: Nombre de la tabla
+    * hit: True si el bloque se encontró en la caché
+    """
+    def recordAccess(self, tableName, hit):
+        with self.lock:
+            counters = self.stats.setdefault(tableName, [0, 0])
+            counters[0 if hit else 1] += 1
+
+    """
+    Función para obtener los aciertos, fallos y tasa de aciertos de una tabla
+    * tableName: Nombre de la tabla
+    """
+    def tableStats(self, tableName):
+        hits, misses = self.stats.get(tableName, [0, 0])
+        total = hits + misses
+        ratio = hits / total if total else 0.0
+        return hits, misses, ratio
+
+    """
+    Función para obtener los bytes ocupados por la caché
+    """
+    def usedBytes(self):
+        return self.singleBytes + self.multiBytes
+
+    #Desaloja bloques hasta respetar el presupuesto. El segmento de un solo acceso se
+    #desaloja primero, así un scan grande no expulsa los bloques calientes.
+    def _evict(self):
+        while self.singleBytes + self.multiBytes > self.maxBytes:
+            if self.single and (self.singleBytes > self.singleMaxBytes or not self.multi):
+                self.singleBytes -= self.single.popitem(last=False)[1][2]
+            else:
+                self.multiBytes -= self.multi.popitem(last=False)[1][2]
+            self.evictions += 1
+
+        #El segmento de múltiples accesos tampoco puede ocupar el espacio del otro
+        while self.multiBytes > self.multiMaxBytes:
+            self.multiBytes -= self.multi.popitem(last=False)[1][2]
+            self.evictions += 1
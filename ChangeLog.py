@@ -0,0 +1,222 @@
+'''
+ * Nombre: ChangeLog.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Registro ordenado de las mutaciones de las tablas para réplicas y consumidores externos.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+import json
+import os
+import time
+import threading
+from bisect import bisect_right
+
+try:
+    import fcntl
+except ImportError:
+    #En Windows no existe fcntl, solo se sincronizan los hilos del mismo proceso
+    fcntl = None
+
+#Cada segmento del registro se llama con el número de secuencia de su primer evento
+SEGMENT_SUFFIX = '.log'
+DEFAULT_SEGMENT_SIZE = 10000
+
+class ChangeLog:
+    """
+    Constructor del registro de cambios
+    * directory: Directorio donde se guardan los segmentos del registro
+    * segmentSize: Número máximo de eventos por segmento
+    """
+    def __init__(self, directory, segmentSize=DEFAULT_SEGMENT_SIZE):
+        self.directory = directory
+        self.segmentSize = segmentSize
+        self.lock = threading.Lock()
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    """
+    Función para obtener los números de secuencia iniciales de los segmentos, en orden
+    """
+    def segments(self):
+        return sorted(int(file[:-len(SEGMENT_SUFFIX)]) for file in os.listdir(self.directory) if file.endswith(SEGMENT_SUFFIX))
+
+    """
+    Función para obtener la ruta de un segmento
+    * firstSequence: Número de secuencia del primer evento del segmento
+    """
+    def segmentPath(self, firstSequence):
+        return os.path.join(self.directory, f"{firstSequence:020d}{SEGMENT_SUFFIX}")
+
+    """
+    Función para obtener el número de secuencia del último evento registrado
+    """
+    def lastSequence(self):
+        segments = self.segments()
+        if not segments:
+            return 0
+
+        #Se lee el último segmento desde el final, por fragmentos, hasta encontrar una línea completa
+        with open(self.segmentPath(segments[-1]), 'rb') as f:
+            position = f.seek(0, 2)
+            buffer = b''
+            while position > 0:
+                step = min(64 * 1024, position)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+                lines = buffer.splitlines()
+
+                #La primera línea del fragmento solo está completa al llegar al inicio del archivo
+                for line in reversed(lines if position == 0 else lines[1:]):
+                    try:
+                        return json.loads(line)["seq"]
+                    except ValueError:
+                        #Línea incompleta de una escritura interrumpida
+                        continue
+        return segments[-1] - 1
+
+    """
+    Función para descartar la línea incompleta que deja una escritura interrumpida al final del último segmento
+    * segments: Números de secuencia iniciales de los segmentos, en orden
+    """
+    def _repairTail(self, segments):
+        if not segments:
+            return
+
+        with open(self.segmentPath(segments[-1]), 'rb+') as f:
+            position = f.seek(0, 2)
+            if position == 0:
+                return
+            f.seek(position - 1)
+            if f.read(1) == b'\n':
+                return
+
+            #Se trunca el segmento después del último salto de línea, el fragmento nunca se confirmó
+            while position > 0:
+                step = min(64 * 1024, position)
+                position -= step
+                f.seek(position)
+                index = f.read(step).rfind(b'\n')
+                if index >= 0:
+                    f.truncate(position + index + 1)
+                    return
+            f.truncate(0)
+
+    """
+    Función para registrar eventos, asignándoles números de secuencia consecutivos
+    * events: Lista de eventos (diccionarios) a registrar
+    """
+    def append(self, events):
+        if not events:
+            return []
+
+        with self.lock, open(os.path.join(self.directory, '.lock'), 'w') as lockFile:
+            if fcntl is not None:
+                fcntl.flock(lockFile, fcntl.LOCK_EX)
+
+            segments = self.segments()
+            self._repairTail(segments)
+            sequence = self.lastSequence()
+            written = []
+            f = None
+            try:
+                for event in events:
+                    sequence += 1
+                    #Se abre un segmento nuevo al llegar al tamaño máximo
+                    if f is None or (sequence - segment) >= self.segmentSize:
+                        if f is not None:
+                            f.close()
+                        segment = segments[-1] if segments and sequence - segments[-1] < self.segmentSize else sequence
+                        segments.append(segment)
+                        f = open(self.segmentPath(segment), 'a')
+                    event = dict(event, seq=sequence)
+                    f.write(json.dumps(event) + '\n')
+                    written.append(event)
+            finally:
+                if f is not None:
+                    f.close()
+
+        return written
+
+class ChangeLogConsumer:
+    """
+    Constructor de un consumidor del registro de cambios
+    * changeLog: Registro de cambios a consumir
+    * fromSequence: Último número de secuencia ya consumido, se leen los eventos posteriores
+    """
+    def __init__(self, changeLog, fromSequence=0):
+        self.changeLog = changeLog
+        self.sequence = fromSequence
+        self.segment = None
+        self.offset = 0
+
+    #Ubica el segmento que contiene el evento siguiente al último consumido
+    def _seek(self):
+        segments = self.changeLog.segments()
+        position = bisect_right(segments, self.sequence + 1) - 1
+        if position < 0:
+            if not segments:
+                return False
+            position = 0
+        self.segment = segments[position]
+        self.offset = 0
+        return True
+
+    """
+    Función para obtener los siguientes eventos del registro
+    * limit: Número máximo de eventos a devolver
+    """
+    def poll(self, limit=1000):
+        events = []
+        if self.segment is None and not self._seek():
+            return events
+
+        while len(events) < limit:
+            path = self.changeLog.segmentPath(self.segment)
+            with open(path, 'r') as f:
+                f.seek(self.offset)
+                while len(events) < limit:
+                    line = f.readline()
+                    #Una línea sin salto de línea aún se está escribiendo
+                    if not line.endswith('\n'):
+                        break
+                    self.offset = f.tell()
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        #Una línea dañada no debe detener a los consumidores, se omite
+                        continue
+                    if event["seq"] > self.sequence:
+                        events.append(event)
+                        self.sequence = event["seq"]
+
+            if len(events) >= limit:
+                break
+
+            #Pasar al siguiente segmento si el actual ya terminó
+            segments = self.changeLog.segments()
+            following = [segment for segment in segments if segment > self.segment]
+            if not following:
+                break
+            self.segment = following[0]
+            self.offset = 0
+
+        return events
+
+    """
+    Función para seguir el registro indefinidamente, esperando nuevos eventos
+    * interval: Segundos de espera cuando no hay eventos nuevos
+    """
+    def tail(self, interval=0.5):
+        while True:
+            events = self.poll()
+            if not events:
+                time.sleep(interval)
+            for event in events:
+                yield event
@@ -0,0 +1,174 @@
+'''
+ * Nombre: Coprocessor.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Coprocesadores que ejecutan lógica junto a los datos: observers con hooks y endpoints de agregación.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+import importlib
+from collections import Counter
+
+#Clase base de los observers de una tabla. Los hooks pre devuelven False para cancelar
+#la operación (con el motivo en self.error) y los hooks post pueden transformar el resultado.
+class RegionObserver:
+    error = None
+
+    """
+    Función que se ejecuta antes de escribir las celdas de una fila
+    * tableName: Nombre de la tabla
+    * rowKey: Row key de la fila
+    * cells: Celdas a escribir, diccionario cf -> {qualifier: {timestamp: valor}}
+    """
+    def prePut(self, tableName, rowKey, cells):
+        return True
+
+    """
+    Función que se ejecuta después de escribir las celdas de una fila
+    * tableName: Nombre de la tabla
+    * rowKey: Row key de la fila
+    * cells: Celdas escritas
+    """
+    def postPut(self, tableName, rowKey, cells):
+        pass
+
+    """
+    Función que se ejecuta antes de eliminar una fila, una column family o una celda
+    * tableName: Nombre de la tabla
+    * rowKey: Row key de la fila
+    * column: family:qualifier, family o None si se elimina la fila completa
+    """
+    def preDelete(self, tableName, rowKey, column):
+        return True
+
+    """
+    Función que se ejecuta después de eliminar una fila, una column family o una celda
+    * tableName: Nombre de la tabla
+    * rowKey: Row key de la fila
+    * column: family:qualifier, family o None si se eliminó la fila completa
+    """
+    def postDelete(self, tableName, rowKey, column):
+        pass
+
+    """
+    Función que se ejecuta antes de leer una fila
+    * tableName: Nombre de la tabla
+    * rowKey: Row key de la fila
+    * families: Column families pedidas (None para todas)
+    """
+    def preGet(self, tableName, rowKey, families):
+        return True
+
+    """
+    Función que se ejecuta después de leer una fila y devuelve la fila que recibe el cliente
+    * tableName: Nombre de la tabla
+    * rowKey: Row key de la fila
+    * rowData: Datos leídos de la fila
+    """
+    def postGet(self, tableName, rowKey, rowData):
+        return rowData
+
+    """
+    Función que se ejecuta antes de escanear una tabla
+    * tableName: Nombre de la tabla
+    * families: Column families pedidas (None para todas)
+    * startRow: Primera row key incluida (opcional)
+    * stopRow: Row key donde se detiene el scan, no incluida (opcional)
+    """
+    def preScan(self, tableName, families, startRow, stopRow):
+        return True
+
+    """
+    Función que se ejecuta después de escanear una tabla y devuelve las filas que recibe el cliente
+    * tableName: Nombre de la tabla
+    * rows: Diccionario rowKey -> datos de la fila
+    """
+    def postScan(self, tableName, rows):
+        return rows
+
+class CapacityValidator(RegionObserver):
+    """
+    Constructor del observer que valida que una columna sea un entero dentro de un rango
+    * column: Columna family:qualifier a validar
+    * minimum: Valor mínimo permitido
+    * maximum: Valor máximo permitido
+    """
+    def __init__(self, column="classrooms:capacity", minimum=1, maximum=500):
+        self.cf, self.qualifier = column.split(':', 1)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.error = None
+
+    #Rechaza la fila si alguna versión de la columna está fuera del rango
+    def prePut(self, tableName, rowKey, cells):
+        for value in cells.get(self.cf, {}).get(self.qualifier, {}).values():
+            try:
+                valid = self.minimum <= int(value) <= self.maximum
+            except ValueError:
+                valid = False
+            if not valid:
+                self.error = f"{self.cf}:{self.qualifier} debe ser un entero entre {self.minimum} y {self.maximum}, se recibió {value!r}"
+                return False
+        return True
+
+"""
+Función endpoint para contar las filas de una tabla
+* rows: Iterador de (rowKey, datos de la fila)
+"""
+def rowCount(rows):
+    return sum(1 for _ in rows)
+
+"""
+Función endpoint para sumar la última versión numérica de una columna
+* rows: Iterador de (rowKey, datos de la fila)
+* column: Columna family:qualifier a sumar
+"""
+def columnSum(rows, column):
+    cf, qualifier = column.split(':', 1)
+    total = 0.0
+    for _, rowData in rows:
+        versions = rowData.get(cf, {}).get(qualifier)
+        if versions:
+            try:
+                total += float(versions[max(versions)])
+            except ValueError:
+                continue
+    return total
+
+"""
+Función endpoint para contar las filas por cada valor de una columna
+* rows: Iterador de (rowKey, datos de la fila)
+* column: Columna family:qualifier a contar
+"""
+def valueCounts(rows, column):
+    cf, qualifier = column.split(':', 1)
+    counts = Counter()
+    for _, rowData in rows:
+        versions = rowData.get(cf, {}).get(qualifier)
+        if versions:
+            counts[versions[max(versions)]] += 1
+    return dict(counts.most_common())
+
+#Endpoints disponibles: nombre -> función
+ENDPOINTS = {
+    "row_count": rowCount,
+    "column_sum": columnSum,
+    "value_counts": valueCounts
+}
+
+"""
+Función para cargar un observer a partir de su ruta module:Class
+* classPath: Ruta del observer, p. ej. Coprocessor:CapacityValidator
+* args: Argumentos del constructor del observer
+"""
+def loadObserver(classPath, *args):
+    moduleName, _, className = classPath.partition(':')
+    observerClass = getattr(importlib.import_module(moduleName), className)
+    if not (isinstance(observerClass, type) and issubclass(observerClass, RegionObserver)):
+        raise TypeError(f"{classPath} no es un RegionObserver")
+    return observerClass(*args)
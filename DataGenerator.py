@@ -14,10 +14,10 @@
 
 import json
 import os
-import uuid
 import random
 from datetime import datetime, timedelta
 from faker import Faker
+from RowKeys import makeRowKey
 
 #Configuración
 seed = 288
@@ -25,6 +25,8 @@ seed = 288
 #5 = 28812
 numRows = 5
 outputFile = "tables/schedules3.json"
+#Estrategia de row keys, p. ej. {"strategy": "composite", "columns": ["classrooms:identifier", "teachers:faculty"], "salt_buckets": 4}
+rowKey = {"strategy": "uuid"}
 
 #Inicializar Faker y establecer semilla
 faker = Faker()
@@ -53,7 +55,8 @@ metadata = {
     "disabled": False,
     "created": datetime.now().isoformat(),
     "modified": datetime.now().isoformat(),
-    "versions": 3
+    "versions": 3,
+    "row_key": rowKey
 }
 
 rows_data = {}
@@ -65,7 +68,6 @@ def random_timestamps(n):
 
 #Generar filas
 for _ in range(numRows):
-    row_id = str(uuid.uuid4())
     classrooms = {
         "identifier": {ts: f"{random.choice(edificios)}-{random.randint(100, 999)}" for ts in random_timestamps(random.randint(1, 3))},
         "capacity": {ts: str(random.randint(20, 50)) for ts in random_timestamps(random.randint(1, 3))},
@@ -75,10 +77,11 @@ for _ in range(numRows):
         "name": {ts: faker.name() for ts in random_timestamps(random.randint(1, 3))},
         "faculty": {ts: random.choice(facultades) for ts in random_timestamps(random.randint(1, 3))}
     }
-    rows_data[row_id] = {
+    row = {
         "classrooms": classrooms,
         "teachers": teachers
     }
+    rows_data[makeRowKey(rowKey, row)] = row
 
 #Estructura completa de la tabla
 schedules_table = {
@@ -93,8 +96,11 @@ if os.path.exists(outputFile):
         print("Operación cancelada.")
         exit()
 
-#Guardar los datos en el archivo JSON
-with open(outputFile, 'w') as f:
+#Guardar los datos en un archivo temporal y reemplazar el anterior, así no se modifica el archivo
+#que comparten los snapshots de la tabla mediante enlaces
+tempFile = f"{outputFile}.{os.getpid()}.tmp"
+with open(tempFile, 'w') as f:
     json.dump(schedules_table, f, indent=4)
+os.replace(tempFile, outputFile)
 
 print(f"Archivo {outputFile} generado con {numRows} filas.")
@@ -14,15 +14,32 @@
 
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 import pyfiglet
 from rich.console import Console
 from rich.style import Style
 from prettytable import PrettyTable
 import fnmatch
-import uuid
 import time
+import shutil
+import threading
+import heapq
+from operator import itemgetter
+from contextlib import contextmanager, nullcontext
+import numpy as np
 from tqdm import tqdm
+from BlockCache import BlockCache, decodedSize
+from ChangeLog import ChangeLog, ChangeLogConsumer
+from StoreFile import writeStoreFile, StoreFileReader, dropExpired, DEFAULT_BLOCK_SIZE, CODECS
+from RowKeys import makeRowKey, keyRanges, prefixRange, ROW_KEY_STRATEGIES
+from Coprocessor import ENDPOINTS, loadObserver
+from Scanner import Scanner, DEFAULT_PAGE_SIZE
+
+try:
+    import fcntl
+except ImportError:
+    #En Windows no existe fcntl, solo se sincronizan los hilos del mismo proceso
+    fcntl = None
 
 #Definir consola y estilos de rich
 console = Console()
@@ -32,22 +49,647 @@ blue = Style(color="blue", bold=True)
 green = Style(color="green", bold=True)
 yellow = Style(color="yellow", bold=True)
 
+#Funciones de agregación disponibles
+AGGREGATIONS = ["count", "sum", "avg", "min", "max"]
+
+#Subdirectorio donde se guardan los snapshots de las tablas
+SNAPSHOT_DIRECTORY = '.snapshots'
+
+#Subdirectorio donde se guarda el registro de cambios de las tablas
+CHANGELOG_DIRECTORY = '.changelog'
+
+#Archivo donde una réplica guarda el último número de secuencia aplicado del primario
+REPLICATION_FILE = '.replication'
+
+#Eventos que modifican celdas y se pueden acumular antes de escribir la tabla
+CELL_EVENTS = ("Put", "DeleteColumn", "DeleteFamily", "DeleteRow")
+
+#Segundos que se conservan los store files reemplazados, para los lectores que ya leyeron el manifiesto anterior
+OBSOLETE_GRACE = 60
+
 class HBase:
     """
     Constructor de la clase HBase
+    * directory: Directorio donde se guardan las tablas
+    * blockCacheSize: Presupuesto global en bytes de la caché de bloques
+    * primary: Directorio del HBase primario, si se indica esta instancia es una réplica de solo lectura
     """
-    def __init__(self, directory='tables'):
+    def __init__(self, directory='tables', blockCacheSize=64 * 1024 * 1024, primary=None):
         self.directory = directory
+        self.blockCache = BlockCache(blockCacheSize)
         if not os.path.exists(directory):
             os.makedirs(directory)
+        self.changeLog = ChangeLog(os.path.join(directory, CHANGELOG_DIRECTORY))
+
+        if primary is not None and os.path.abspath(primary) == os.path.abspath(directory):
+            raise ValueError("El directorio de la réplica debe ser distinto al del primario")
+        self.primary = primary
+        self.primaryLog = ChangeLog(os.path.join(primary, CHANGELOG_DIRECTORY)) if primary is not None else None
+        self.consumer = None
+        self.replicationLock = threading.Lock()
+        self.replicationError = None
+
+        #Observers registrados por tabla y endpoints disponibles
+        self.coprocessors = {}
+        self.endpoints = dict(ENDPOINTS)
+
+        #Cursor del último scan, continúa con nextPage
+        self.scanner = None
+
+        #Nombre de la tabla guardada en cada archivo: filePath -> (stamp, tableName), evita leer las tablas para buscarlas
+        self.tableNames = {}
+
+        #Sincroniza las escrituras de los hilos de este proceso, entre procesos se usa el lock de cada tabla
+        self.writeLock = threading.Lock()
+
+    """
+    Función para verificar que la instancia acepte escrituras, las réplicas son de solo lectura
+    """
+    def _checkWritable(self):
+        if self.primary is not None:
+            console.print(f'ERROR: Esta instancia es una réplica de solo lectura de {self.primary}.', style=red)
+            return False
+        return True
+
+    """
+    Función para ejecutar un hook pre en los observers de una tabla
+    * tableName: Nombre de la tabla
+    * hook: Nombre del hook (prePut, preDelete, preGet, preScan)
+    * args: Argumentos del hook
+    """
+    def _preHook(self, tableName, hook, *args):
+        for observer in self.coprocessors.get(tableName, []):
+            if getattr(observer, hook)(tableName, *args) is False:
+                reason = f": {observer.error}" if observer.error else "."
+                console.print(f'ERROR: El coprocesador {type(observer).__name__} canceló la operación{reason}', style=red)
+                return False
+        return True
+
+    """
+    Función para ejecutar un hook post en los observers de una tabla
+    * tableName: Nombre de la tabla
+    * hook: Nombre del hook (postPut, postDelete, postGet, postScan)
+    * args: Argumentos del hook, el último es el resultado que los observers pueden reemplazar
+    """
+    def _postHook(self, tableName, hook, *args):
+        result = args[-1]
+        for observer in self.coprocessors.get(tableName, []):
+            returned = getattr(observer, hook)(tableName, *args[:-1], result)
+            if returned is not None:
+                result = returned
+        return result
+
+    """
+    Función para crear un evento del registro de cambios
+    * tableName: Nombre de la tabla modificada
+    * eventType: Tipo de cambio (Put, DeleteColumn, DeleteFamily, DeleteRow, Truncate, Alter, Create, Drop, Enable, Disable, Clone, Restore)
+    * row: Row key afectada (opcional)
+    * column: Columna family:qualifier o column family afectada (opcional)
+    * timestamp: Timestamp de la celda o del cambio
+    * value: Valor escrito, None para los borrados
+    * extra: Campos adicionales del evento
+    """
+    def _event(self, tableName, eventType, row=None, column=None, timestamp=None, value=None, **extra):
+        event = {
+            "table": tableName,
+            "type": eventType,
+            "row": row,
+            "column": column,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "value": value
+        }
+        event.update(extra)
+        return event
+
+    """
+    Función para leer una tabla pasando por la caché de bloques
+    * filePath: Ruta del archivo JSON de la tabla
+    * cacheBlocks: False para no guardar en caché los bloques leídos (scans grandes de una sola vez)
+    * forUpdate: True para obtener una copia propia que puede modificarse y escribirse
+    Sin forUpdate el contenido puede estar compartido por la caché y no debe modificarse
+    """
+    def _readTable(self, filePath, cacheBlocks=True, forUpdate=False):
+        #Los archivos de tabla se guardan completos, por lo que son un único bloque en el offset 0
+        stamp = self._fileStamp(filePath)
+        key = (filePath, 0)
+
+        if not forUpdate:
+            data = self.blockCache.getBlock(key, stamp)
+            if data is not None:
+                self.blockCache.recordAccess(data["metadata"]["table_name"], True)
+                return data
+
+        with open(filePath, 'r') as f:
+            data = json.load(f)
+        self.tableNames[filePath] = (stamp, data["metadata"]["table_name"])
+
+        if not forUpdate:
+            self.blockCache.recordAccess(data["metadata"]["table_name"], False)
+            if cacheBlocks:
+                #La caché se cobra por el tamaño decodificado, varias veces mayor que el archivo JSON
+                self.blockCache.cacheBlock(key, stamp, data, decodedSize(data))
+        return data
+
+    """
+    Función para obtener el sello de validez de un archivo
+    * filePath: Ruta del archivo
+    """
+    def _fileStamp(self, filePath):
+        #Cada escritura reemplaza el archivo, por lo que el inodo distingue las versiones
+        stat = os.stat(filePath)
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    """
+    Función para obtener el nombre de la tabla guardada en un archivo sin pasar por la caché de bloques
+    ni registrar accesos en sus estadísticas
+    * filePath: Ruta del archivo JSON de la tabla
+    """
+    def _tableName(self, filePath):
+        stamp = self._fileStamp(filePath)
+        cached = self.tableNames.get(filePath)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with open(filePath, 'r') as f:
+            tableName = json.load(f)["metadata"]["table_name"]
+        self.tableNames[filePath] = (stamp, tableName)
+        return tableName
+
+    """
+    Función para obtener una ruta temporal propia del proceso e hilo que escribe un archivo
+    * filePath: Ruta del archivo que se reemplazará
+    """
+    def _tempPath(self, filePath):
+        return f"{filePath}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    """
+    Función para escribir una tabla e invalidar sus bloques en caché
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido completo de la tabla
+    * families: Column families modificadas, en tablas columnares solo se reescriben sus store files (None para todas)
+    """
+    def _writeTable(self, filePath, data, families=None):
+        metadata = data["metadata"]
+        oldStoreFiles = []
+
+        #Cada versión confirmada de la tabla tiene un número de secuencia, los lectores lo usan como read point
+        metadata["sequence"] = metadata.get("sequence", 0) + 1
+
+        #En tablas columnares cada column family se escribe en un store file nuevo
+        #y el archivo JSON de la tabla solo guarda los metadatos
+        if metadata.get("storage") == "columnar":
+            if "rows_data" in data:
+                storeDirectory = self._storeDirectory(filePath)
+                os.makedirs(storeDirectory, exist_ok=True)
+
+                for cf in metadata["column_families"]:
+                    family = metadata.setdefault("families", {}).setdefault(cf, {})
+                    #Las column families sin cambios conservan su store file
+                    if families is not None and cf not in families and family.get("store_file"):
+                        continue
+                    familyRows = {rowKey: rowData[cf] for rowKey, rowData in data["rows_data"].items() if cf in rowData}
+
+                    #Si otra escritura ya usó el siguiente número de secuencia se prueba con el siguiente
+                    settings = self._familySettings(metadata, cf)
+                    while True:
+                        metadata["store_sequence"] = metadata.get("store_sequence", 0) + 1
+                        storeFile = f"{cf}.{metadata['store_sequence']:06d}.store"
+                        try:
+                            writeStoreFile(os.path.join(storeDirectory, storeFile), familyRows, settings["block_size"], settings["compression"])
+                            break
+                        except FileExistsError:
+                            continue
+
+                    if family.get("store_file"):
+                        oldStoreFiles.append(family["store_file"])
+                    family["store_file"] = storeFile
+
+                #Los store files reemplazados se eliminan hasta que pasa el tiempo de gracia, así un lector
+                #que leyó el manifiesto anterior todavía puede abrirlos. Una vez abiertos no importa que se eliminen.
+                now = time.time()
+                obsolete = metadata.setdefault("obsolete_store_files", {})
+                for oldStoreFile in oldStoreFiles:
+                    obsolete[oldStoreFile] = now
+                oldStoreFiles = [storeFile for storeFile, replaced in obsolete.items() if now - replaced >= OBSOLETE_GRACE]
+                for storeFile in oldStoreFiles:
+                    del obsolete[storeFile]
+                oldStoreFiles = [os.path.join(storeDirectory, storeFile) for storeFile in oldStoreFiles]
+
+            data = {"metadata": metadata}
+
+        #Escribir en un archivo temporal propio y reemplazar, así el archivo anterior nunca se modifica,
+        #los lectores ven la versión anterior o la nueva completa y los snapshots que lo enlazan conservan su contenido
+        tempPath = self._tempPath(filePath)
+        with open(tempPath, 'w') as f:
+            json.dump(data, f, indent=4)
+        #El reemplazo conserva el inodo y la fecha del archivo temporal, por lo que su sello es el del archivo final
+        stamp = self._fileStamp(tempPath)
+        os.replace(tempPath, filePath)
+        self.blockCache.evictFile(filePath)
+        self.tableNames[filePath] = (stamp, metadata["table_name"])
+
+        for oldStoreFile in oldStoreFiles:
+            if os.path.exists(oldStoreFile):
+                os.remove(oldStoreFile)
+            self.blockCache.evictFile(oldStoreFile)
+
+    """
+    Función para bloquear las escrituras de una tabla entre hilos y procesos, los lectores nunca se bloquean
+    * filePath: Ruta del archivo JSON de la tabla
+    """
+    @contextmanager
+    def _tableLock(self, filePath):
+        with self.writeLock, open(filePath + '.lock', 'w') as lockFile:
+            if fcntl is not None:
+                fcntl.flock(lockFile, fcntl.LOCK_EX)
+            yield
+
+    """
+    Función para obtener las column families que modifican unos eventos de celda
+    * events: Eventos de celda
+    """
+    def _eventFamilies(self, events):
+        families = set()
+        for event in events:
+            #Eliminar una fila completa modifica todas sus column families
+            if event["type"] == "DeleteRow":
+                return None
+            families.add(event["column"].split(':', 1)[0])
+        return families
+
+    """
+    Función para confirmar las mutaciones de celdas de una tabla y registrarlas en el registro de cambios
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido completo de la tabla con las mutaciones aplicadas
+    * events: Eventos de celda que describen las mutaciones
+    """
+    def _commit(self, filePath, data, events):
+        #Sin mutaciones no se reescribe la tabla ni se avanza su número de secuencia
+        if not events:
+            return data["metadata"].get("sequence", 0)
+
+        with self._tableLock(filePath):
+            current = self._readTable(filePath, forUpdate=True)
+
+            #Si otro escritor confirmó una versión desde que se leyó la tabla, las mutaciones se aplican
+            #sobre la versión actual en lugar de sobrescribir sus cambios
+            if current["metadata"].get("sequence", 0) != data["metadata"].get("sequence", 0):
+                data = self._loadRows(filePath, current, forUpdate=True)
+                for event in events:
+                    self._applyCellEvent(data, event)
+
+            self._writeTable(filePath, data, self._eventFamilies(events))
+            self.changeLog.append(events)
+        return data["metadata"]["sequence"]
+
+    """
+    Función para obtener la configuración de una column family
+    * metadata: Metadatos de la tabla
+    * cf: Nombre de la column family
+    """
+    def _familySettings(self, metadata, cf):
+        settings = {
+            "versions": metadata.get("versions", 3),
+            "block_size": DEFAULT_BLOCK_SIZE,
+            "compression": "none",
+            "ttl": None
+        }
+        settings.update(metadata.get("families", {}).get(cf, {}))
+        return settings
+
+    """
+    Función para obtener el timestamp más antiguo que se conserva en cada column family con TTL
+    * metadata: Metadatos de la tabla
+    """
+    def _ttlCutoffs(self, metadata):
+        now = datetime.now()
+        cutoffs = {}
+        for cf in metadata["column_families"]:
+            ttl = self._familySettings(metadata, cf)["ttl"]
+            if ttl:
+                cutoffs[cf] = (now - timedelta(seconds=ttl)).isoformat()
+        return cutoffs
+
+    """
+    Función para proyectar las column families de una fila y descartar las celdas expiradas
+    * rowData: Datos de la fila
+    * families: Lista de column families a conservar (None para todas)
+    * cutoffs: Timestamp más antiguo que se conserva por column family
+    """
+    def _liveRow(self, rowData, families, cutoffs):
+        live = {}
+        for cf, cells in rowData.items():
+            if families is not None and cf not in families:
+                continue
+            if cf in cutoffs:
+                cells = dropExpired(cells, cutoffs[cf])
+                if not cells:
+                    continue
+            live[cf] = cells
+        return live
+
+    """
+    Función para copiar las celdas de una fila, así quien la recibe puede modificarla sin alterar
+    los bloques compartidos de la caché
+    * rowData: Datos de la fila
+    """
+    def _copyRow(self, rowData):
+        return {cf: {qualifier: dict(versions) for qualifier, versions in cells.items()} for cf, cells in rowData.items()}
+
+    """
+    Función para obtener el directorio de store files de una tabla columnar
+    * filePath: Ruta del archivo JSON de la tabla
+    """
+    def _storeDirectory(self, filePath):
+        return os.path.splitext(filePath)[0] + '.families'
+
+    """
+    Función para eliminar los store files de una tabla columnar
+    * filePath: Ruta del archivo JSON de la tabla
+    """
+    def _dropStore(self, filePath):
+        storeDirectory = self._storeDirectory(filePath)
+        if os.path.isdir(storeDirectory):
+            for storeFile in os.listdir(storeDirectory):
+                self.blockCache.evictFile(os.path.join(storeDirectory, storeFile))
+            shutil.rmtree(storeDirectory)
+
+    """
+    Función para enlazar un archivo sin copiarlo, o copiarlo si el sistema no permite hard links
+    * source: Ruta del archivo original
+    * target: Ruta del nuevo enlace
+    """
+    def _linkFile(self, source, target):
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    """
+    Función para obtener el directorio de un snapshot
+    * snapshotName: Nombre del snapshot
+    """
+    def _snapshotDirectory(self, snapshotName):
+        return os.path.join(self.directory, SNAPSHOT_DIRECTORY, snapshotName)
+
+    """
+    Función para leer el manifiesto de un snapshot
+    * snapshotName: Nombre del snapshot
+    """
+    def _readSnapshot(self, snapshotName):
+        manifestPath = os.path.join(self._snapshotDirectory(snapshotName), 'manifest.json')
+        if not snapshotName or not os.path.exists(manifestPath):
+            return None
+        with open(manifestPath, 'r') as f:
+            return json.load(f)
+
+    """
+    Función para abrir el store file de una column family
+    * filePath: Ruta del archivo JSON de la tabla
+    * metadata: Metadatos de la tabla
+    * cf: Nombre de la column family
+    * useCache: False para leer los bloques sin pasar por la caché
+    """
+    def _openStore(self, filePath, metadata, cf, useCache=True):
+        storeFile = metadata.get("families", {}).get(cf, {}).get("store_file")
+        if not storeFile:
+            return None
+
+        blockCache = self.blockCache if useCache else None
+        return StoreFileReader(os.path.join(self._storeDirectory(filePath), storeFile), blockCache, metadata["table_name"])
+
+    """
+    Función para recorrer en orden las filas de una tabla sin cargarlas todas en memoria
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido del archivo JSON de la tabla
+    * families: Lista de column families a leer (None para todas)
+    * cacheBlocks: False para no guardar en caché los bloques leídos
+    * forUpdate: True para leer los bloques sin pasar por la caché
+    * startRow: Primera row key incluida, sin prefijo de sal (opcional)
+    * stopRow: Row key donde se detiene la lectura, no incluida, sin prefijo de sal (opcional)
+    * applyTtl: False para incluir también las celdas expiradas
+    Devuelve el iterador de (rowKey, datos de la fila) y los store files abiertos, que debe cerrar quien lo llama
+    """
+    def _scanRows(self, filePath, data, families=None, cacheBlocks=True, forUpdate=False, startRow=None, stopRow=None, applyTtl=True):
+        metadata = data["metadata"]
+        cutoffs = self._ttlCutoffs(metadata) if applyTtl else {}
+
+        #En tablas con sal el rango se lee por separado en cada bucket
+        ranges = keyRanges(metadata.get("row_key"), startRow, stopRow)
+
+        if metadata.get("storage") != "columnar":
+            def rows():
+                for rowID, rowData in data["rows_data"].items():
+                    if not any((start is None or rowID >= start) and (stop is None or rowID < stop) for start, stop in ranges):
+                        continue
+                    projected = self._liveRow(rowData, families, cutoffs)
+                    if projected:
+                        yield rowID, projected
+            return rows(), []
+
+        #Los store files se abren al iniciar el scan, así el cursor sigue leyendo los mismos archivos
+        #aunque una escritura los reemplace mientras está abierto
+        readers = []
+        for cf in metadata["column_families"]:
+            if families is not None and cf not in families:
+                continue
+            reader = self._openStore(filePath, metadata, cf, useCache=not forUpdate)
+            if reader is not None:
+                readers.append((cf, reader))
+
+        def familyCells(cf, reader, start, stop):
+            for rowKey, cells in reader.scan(start, stop, cacheBlocks, cutoffs.get(cf)):
+                yield rowKey, cf, cells
+
+        #Cada store file está ordenado por row key, se mezclan fila por fila sin leerlos completos
+        def rows():
+            for start, stop in ranges:
+                streams = [familyCells(cf, reader, start, stop) for cf, reader in readers]
+                currentKey = None
+                currentRow = {}
+                for rowKey, cf, cells in heapq.merge(*streams, key=itemgetter(0)):
+                    if rowKey != currentKey:
+                        if currentKey is not None:
+                            yield currentKey, currentRow
+                        currentKey = rowKey
+                        currentRow = {}
+                    currentRow[cf] = cells
+                if currentKey is not None:
+                    yield currentKey, currentRow
+
+        return rows(), [reader for _, reader in readers]
+
+    """
+    Función para obtener las filas de una tabla, abriendo solo las column families pedidas
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido del archivo JSON de la tabla
+    * families: Lista de column families a leer (None para todas)
+    * cacheBlocks: False para no guardar en caché los bloques leídos
+    * forUpdate: True para obtener filas propias que pueden modificarse y escribirse
+    * startRow: Primera row key incluida, sin prefijo de sal (opcional)
+    * stopRow: Row key donde se detiene la lectura, no incluida, sin prefijo de sal (opcional)
+    * applyTtl: False para incluir también las celdas expiradas
+    """
+    def _loadRows(self, filePath, data, families=None, cacheBlocks=True, forUpdate=False, startRow=None, stopRow=None, applyTtl=True):
+        metadata = data["metadata"]
+        if metadata.get("storage") != "columnar" and families is None and startRow is None and stopRow is None:
+            if not applyTtl or not self._ttlCutoffs(metadata):
+                return data
+
+        rows, readers = self._scanRows(filePath, data, families, cacheBlocks, forUpdate, startRow, stopRow, applyTtl)
+        try:
+            rowsData = dict(rows)
+        finally:
+            for reader in readers:
+                reader.close()
+        return {"metadata": metadata, "rows_data": rowsData}
+
+    """
+    Función para obtener una fila de una tabla sin leer la tabla completa
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido del archivo JSON de la tabla
+    * rowID: ID de la fila
+    * families: Lista de column families a leer (None para todas)
+    """
+    def _getRow(self, filePath, data, rowID, families=None):
+        return self._getRows(filePath, data, [rowID], families).get(rowID)
+
+    """
+    Función para obtener varias filas de una tabla en una sola pasada ordenada
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido del archivo JSON de la tabla
+    * rowKeys: Row keys a obtener
+    * families: Lista de column families a leer (None para todas)
+    """
+    def _getRows(self, filePath, data, rowKeys, families=None):
+        metadata = data["metadata"]
+        sortedKeys = sorted(set(rowKeys))
+        cutoffs = self._ttlCutoffs(metadata)
+        rowsData = {}
+
+        if metadata.get("storage") != "columnar":
+            for rowKey in sortedKeys:
+                rowData = data["rows_data"].get(rowKey)
+                if rowData is not None:
+                    rowData = self._liveRow(rowData, families, cutoffs)
+                if rowData:
+                    rowsData[rowKey] = rowData
+            return rowsData
+
+        #Cada store file se abre una vez y cada bloque se decodifica a lo sumo una vez
+        for cf in metadata["column_families"]:
+            if families is not None and cf not in families:
+                continue
+
+            reader = self._openStore(filePath, metadata, cf)
+            if reader is None:
+                continue
+            with reader:
+                for rowKey, cells in reader.getRows(sortedKeys, minTimestamp=cutoffs.get(cf)):
+                    rowsData.setdefault(rowKey, {})[cf] = cells
+
+        return rowsData
+
+    """
+    Función para verificar que las column families pedidas existan en la tabla
+    * data: Contenido del archivo JSON de la tabla
+    * families: Lista de column families (None para todas)
+    """
+    def _checkFamilies(self, data, families):
+        for cf in families or []:
+            if cf not in data["metadata"]["column_families"]:
+                console.print(f'ERROR: La column family {cf} no existe en la tabla {data["metadata"]["table_name"]}.', style=red)
+                return False
+        return True
+
+    """
+    Función para verificar que la configuración de las column families sea válida
+    * familySettings: Configuración por column family
+    * storage: Almacenamiento de la tabla, 'row' o 'columnar'
+    """
+    def _checkFamilySettings(self, familySettings, storage):
+        for cf, settings in (familySettings or {}).items():
+            #Las tablas de filas no tienen store files, por lo que no usan bloques ni compresión
+            if storage != 'columnar' and ("block_size" in settings or "compression" in settings):
+                console.print(f'ERROR: block_size y compression solo aplican a tablas columnares, la column family {cf} se guarda por filas.', style=red)
+                return False
+            compression = settings.get("compression", "none")
+            if compression not in CODECS:
+                console.print(f'ERROR: Compresión {compression} no válida para {cf}. Use una de: {", ".join(CODECS)}.', style=red)
+                return False
+            if settings.get("ttl") is not None and settings["ttl"] < 0:
+                console.print(f'ERROR: El TTL de {cf} debe ser un número de segundos positivo.', style=red)
+                return False
+        return True
+
+    """
+    Función para verificar que la estrategia de row keys sea válida
+    * rowKey: Estrategia de row keys
+    * columnFamilies: Column families de la tabla
+    """
+    def _checkRowKey(self, rowKey, columnFamilies):
+        rowKey = rowKey or {}
+        strategy = rowKey.get("strategy", "uuid")
+        if strategy not in ROW_KEY_STRATEGIES:
+            console.print(f'ERROR: Estrategia de row keys {strategy} no válida. Use una de: {", ".join(ROW_KEY_STRATEGIES)}.', style=red)
+            return False
+        if strategy == "composite":
+            if not rowKey.get("columns"):
+                console.print('ERROR: Las row keys compuestas necesitan al menos una columna family:qualifier.', style=red)
+                return False
+            for column in rowKey["columns"]:
+                if ':' not in column or column.split(':', 1)[0] not in columnFamilies:
+                    console.print(f'ERROR: La columna {column} no es válida, use family:qualifier con una column family de la tabla.', style=red)
+                    return False
+        if rowKey.get("salt_buckets") is not None and rowKey["salt_buckets"] < 0:
+            console.print('ERROR: El número de buckets de sal debe ser positivo.', style=red)
+            return False
+        return True
+
+    """
+    Función para obtener la tasa de compresión de una column family
+    * filePath: Ruta del archivo JSON de la tabla
+    * metadata: Metadatos de la tabla
+    * cf: Nombre de la column family
+    """
+    def _compressionRatio(self, filePath, metadata, cf):
+        reader = self._openStore(filePath, metadata, cf)
+        if reader is None:
+            return "N/A"
+        with reader:
+            rawBytes, storedBytes = reader.sizes()
+        if not storedBytes:
+            return "N/A"
+        return f"{rawBytes / storedBytes:.2f}x ({rawBytes} -> {storedBytes} bytes)"
+
+    """
+    Función para encontrar el archivo de una tabla por su nombre
+    * tableName: Nombre de la tabla
+    * cacheBlocks: False para no guardar en caché los bloques leídos
+    """
+    def _findTable(self, tableName, cacheBlocks=True):
+        #Solo se lee, y se cuenta en las estadísticas de la caché, la tabla buscada
+        for file in os.listdir(self.directory):
+            if file.endswith('.json'):
+                filePath = os.path.join(self.directory, file)
+                if self._tableName(filePath) == tableName:
+                    return filePath, self._readTable(filePath, cacheBlocks)
+        return None, None
     
     """
     Función para crear una tabla en HBase
     * fileName: Nombre del archivo JSON donde se guardará la tabla
     * tableName: Nombre de la tabla
     * columnFamilies: Lista de column families de la tabla
+    * versions: Número máximo de versiones por celda
+    * storage: 'row' para guardar las filas completas o 'columnar' para un store file por column family
+    * familySettings: Configuración por column family, p. ej. {"teachers": {"versions": 1}}
+    * rowKey: Estrategia de row keys, p. ej. {"strategy": "composite", "columns": ["classrooms:identifier"], "salt_buckets": 4}
     """
-    def create(self, fileName, tableName, columnFamilies, versions):    
+    def create(self, fileName, tableName, columnFamilies, versions, storage='row', familySettings=None, rowKey=None):    
+        if not self._checkWritable():
+            return
+
         #Definir la estructura de la tabla
         tableStructure = {
             "metadata": {
@@ -56,7 +698,10 @@ class HBase:
                 "disabled": False,
                 "created": datetime.now().isoformat(),
                 "modified": datetime.now().isoformat(),
-                "versions": versions
+                "versions": versions,
+                "storage": storage,
+                "families": {cf: dict((familySettings or {}).get(cf, {})) for cf in columnFamilies},
+                "row_key": rowKey or {"strategy": "uuid"}
                 #"rows_counter": 0
             },
             "rows_data": {}
@@ -75,9 +720,24 @@ class HBase:
         if columnFamilies == [''] or tableName == "":
             console.print("ERROR: Debe ingresar todos los parámetros.", style=red)
             return
+        elif storage not in ('row', 'columnar'):
+            console.print(f"ERROR: Tipo de almacenamiento {storage} no válido. Use 'row' o 'columnar'.", style=red)
+            return
+        elif not self._checkFamilySettings(familySettings, storage):
+            return
+        elif not self._checkRowKey(rowKey, columnFamilies):
+            return
         else:
-            with open(filePath, 'w') as f:
-                json.dump(tableStructure, f, indent=4)
+            with self._tableLock(filePath):
+                #Al sobrescribir una tabla se continúan sus secuencias, así un escritor que leyó la tabla anterior
+                #no pasa la verificación de _commit ni reutiliza nombres de store files
+                if os.path.exists(filePath):
+                    previous = self._readTable(filePath, cacheBlocks=False)["metadata"]
+                    tableStructure["metadata"]["sequence"] = previous.get("sequence", 0)
+                    tableStructure["metadata"]["store_sequence"] = previous.get("store_sequence", 0)
+                self._dropStore(filePath)
+                self._writeTable(filePath, tableStructure)
+                self.changeLog.append([self._event(tableName, "Create", file_name=fileName, metadata=tableStructure["metadata"])])
         
         console.print(f'SISTEMA: Tabla {tableName} creada en {filePath}.', style=blue)
     
@@ -92,9 +752,8 @@ class HBase:
             if file.endswith('.json'):
                 tableName = file.replace('.json', '')
                 filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                    columnFamilies = ", ".join(data["metadata"]["column_families"])
+                data = self._readTable(filePath)
+                columnFamilies = ", ".join(data["metadata"]["column_families"])
                 listTable.add_row([tableName, columnFamilies])
         
         print(listTable)
@@ -104,30 +763,29 @@ class HBase:
     * tableName: Nombre de la tabla a deshabilitar
     """
     def changeStatus(self, tableName, action):
-        found = False
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                    if data["metadata"]["table_name"] == tableName:
-                        if action == "disable":
-                            data["metadata"]["disabled"] = True
-                        elif action == "enable":
-                            data["metadata"]["disabled"] = False
-                        data["metadata"]["modified"] = datetime.now().isoformat()
-                        found = True
-                        with open(filePath, 'w') as f_write:
-                            json.dump(data, f_write, indent=4)
-                        if action == "disable":
-                            console.print(f'SISTEMA: Tabla {tableName} deshabilitada.', style=blue)
-                        elif action == "enable":
-                            console.print(f'SISTEMA: Tabla {tableName} habilitada.', style=blue)
-                        break
-        
-        if not found:
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
             print()
             console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        with self._tableLock(filePath):
+            data = self._readTable(filePath, forUpdate=True)
+            if action == "disable":
+                data["metadata"]["disabled"] = True
+            elif action == "enable":
+                data["metadata"]["disabled"] = False
+            data["metadata"]["modified"] = datetime.now().isoformat()
+            self._writeTable(filePath, data)
+            self.changeLog.append([self._event(tableName, action.capitalize())])
+        if action == "disable":
+            console.print(f'SISTEMA: Tabla {tableName} deshabilitada.', style=blue)
+        elif action == "enable":
+            console.print(f'SISTEMA: Tabla {tableName} habilitada.', style=blue)
             
     
     """
@@ -135,518 +793,1538 @@ class HBase:
     * tableName: Nombre de la tabla a verificar
     """
     def is_enabled(self, tableName):
-        found = False
-
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
+        filePath, data = self._findTable(tableName)
 
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-
-                    if data["metadata"]["table_name"] == tableName:
-                        found = True
-                        if data["metadata"]["disabled"]:
-                            console.print(f'Tabla {tableName} SI está deshabilitada.', style=yellow)
-                        else:
-                            console.print(f'Tabla {tableName} NO está deshabilitada.', style=green)
-                        break
-        
-        if not found:
+        if filePath is None:
             console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+        elif data["metadata"]["disabled"]:
+            console.print(f'Tabla {tableName} SI está deshabilitada.', style=yellow)
+        else:
+            console.print(f'Tabla {tableName} NO está deshabilitada.', style=green)
 
     """
     Función para alterar una tabla en HBase
     * tableName: Nombre de la tabla a alterar
     * newTableName: Nuevo nombre de la tabla
     * newColumnFamilies: Nuevas column families de la tabla
+    * familySettings: Cambios en la configuración por column family, p. ej. {"teachers": {"versions": 1}}
+    * storage: Nuevo almacenamiento de la tabla, 'row' o 'columnar' (opcional)
+    """
+    def alter(self, tableName, newTableName, newColumnFamilies, familySettings=None, storage=None):
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        if storage not in (None, 'row', 'columnar'):
+            console.print(f"ERROR: Tipo de almacenamiento {storage} no válido. Use 'row' o 'columnar'.", style=red)
+            return
+
+        #La tabla se vuelve a leer bajo el bloqueo, así ninguna escritura confirmada mientras tanto se pierde
+        with self._tableLock(filePath):
+            data = self._readTable(filePath, forUpdate=True)
+            if not data["metadata"]["disabled"]:
+                console.print(f'ERROR: Tabla {tableName} está habilitada y no puede ser alterada.', style=red)
+                return
+
+            if not self._checkFamilySettings(familySettings, storage or data["metadata"].get("storage", "row")):
+                return
+
+            #Las filas se leen con el almacenamiento anterior antes de convertir la tabla
+            converted = storage is not None and storage != data["metadata"].get("storage", "row")
+            if converted:
+                data = self._convertStorage(filePath, data, storage)
+
+            #Actualizar los metadatos de la tabla
+            data["metadata"]["table_name"] = newTableName
+            if newColumnFamilies != ['']:
+                data["metadata"]["column_families"] += newColumnFamilies
+            for cf, settings in (familySettings or {}).items():
+                if cf not in data["metadata"]["column_families"]:
+                    console.print(f'ERROR: La column family {cf} no existe en la tabla {tableName}.', style=red)
+                    return
+                data["metadata"].setdefault("families", {}).setdefault(cf, {}).update(settings)
+            data["metadata"]["modified"] = datetime.now().isoformat()
+
+            #Reescribir los store files para que la nueva configuración (p. ej. compresión) se aplique de inmediato
+            if familySettings and not converted:
+                data = self._loadRows(filePath, data, forUpdate=True)
+
+            #Guardar los cambios en el archivo JSON
+            self._writeTable(filePath, data)
+            if converted and storage == 'row':
+                self._dropStore(filePath)
+            self.changeLog.append([self._event(tableName, "Alter", new_table_name=newTableName,
+                                               new_column_families=[cf for cf in newColumnFamilies if cf], family_settings=familySettings or {},
+                                               storage=storage)])
+
+        console.print(f"SISTEMA: Tabla {tableName} ha sido alterada a {newTableName} con nuevas column families.", style=blue)
+
+    """
+    Función para convertir una tabla a otro almacenamiento, leyendo sus filas con el almacenamiento actual
+    * filePath: Ruta del archivo JSON de la tabla
+    * data: Contenido de la tabla
+    * storage: Nuevo almacenamiento, 'row' o 'columnar'
+    """
+    def _convertStorage(self, filePath, data, storage):
+        data = self._loadRows(filePath, data, forUpdate=True)
+        metadata = data["metadata"]
+        metadata["storage"] = storage
+
+        #En una tabla de filas los store files anteriores se eliminan, sus referencias ya no aplican
+        if storage == 'row':
+            metadata.pop("obsolete_store_files", None)
+            for family in metadata.get("families", {}).values():
+                family.pop("store_file", None)
+        return data
+
+    """
+    Función para eliminar una tabla en HBase
+    * tableName: Nombre de la tabla a eliminar
     """
-    def alter(self, tableName, newTableName, newColumnFamilies):
+    def drop(self, tableName):
+        if not self._checkWritable():
+            return
+
         found = False
 
         for file in os.listdir(self.directory):
             if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-
-                    if data["metadata"]["table_name"] == tableName:
-                        if data["metadata"]["disabled"]:
-                            #Actualizar los metadatos de la tabla
-                            data["metadata"]["table_name"] = newTableName
-                            if newColumnFamilies != ['']:
-                                data["metadata"]["column_families"] += newColumnFamilies
-                            data["metadata"]["modified"] = datetime.now().isoformat()
-                            found = True
-
-                            #Guardar los cambios en el archivo JSON
-                            with open(filePath, 'w') as f_write:
-                                json.dump(data, f_write, indent=4)
-                            
-                            console.print(f"SISTEMA: Tabla {tableName} ha sido alterada a {newTableName} con nuevas column families.", style=blue)
-                        else:
-                            found = True
-                            console.print(f'ERROR: Tabla {tableName} está habilitada y no puede ser alterada.', style=red)
+                file_path = os.path.join(self.directory, file)
 
+                if self._tableName(file_path) == tableName:
+                    found = True
+                    if not self._dropTable(file_path, tableName):
                         break
         
         if not found:
             console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
 
     """
-    Función para eliminar una tabla en HBase
-    * tableName: Nombre de la tabla a eliminar
+    Función para eliminar el archivo de una tabla deshabilitada, verificando su estado bajo el bloqueo de escritura
+    * filePath: Ruta del archivo JSON de la tabla
+    * tableName: Nombre de la tabla
     """
-    def drop(self, tableName):
+    def _dropTable(self, filePath, tableName):
+        with self._tableLock(filePath):
+            if not self._readTable(filePath, cacheBlocks=False)["metadata"]["disabled"]:
+                console.print(f'ERROR: Tabla {tableName} está habilitada y no puede ser eliminada.', style=red)
+                return False
+            try:
+                os.remove(filePath)
+                self.blockCache.evictFile(filePath)
+                self._dropStore(filePath)
+                if os.path.exists(filePath + '.lock'):
+                    os.remove(filePath + '.lock')
+                self.changeLog.append([self._event(tableName, "Drop")])
+            except PermissionError:
+                console.print(f'EROR: No se puede eliminar la tabla {tableName} pues el archivo está en uso.', style=red)
+                return True
+        console.print(f"SISTEMA: Tabla {tableName} ha sido eliminada.", style=blue)
+        return True
+
+    """
+    Función para eliminar todas las tablas que coincidan con un patrón
+    * pattern: Patrón de las tablas a eliminar
+    """
+    def drop_all(self, pattern):
+        if not self._checkWritable():
+            return
+
         found = False
 
         for file in os.listdir(self.directory):
             if file.endswith('.json'):
                 file_path = os.path.join(self.directory, file)
 
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                tableName = self._tableName(file_path)
 
-                if data["metadata"]["table_name"] == tableName:
+                if fnmatch.fnmatch(tableName, pattern):
                     found = True
-                    if data["metadata"]["disabled"]:
-                        try:
-                            os.remove(file_path)
-                            console.print(f"SISTEMA: Tabla {tableName} ha sido eliminada.", style=blue)
-                        except PermissionError:
-                            console.print(f'EROR: No se puede eliminar la tabla {tableName} pues el archivo está en uso.', style=red)
-                    else:
-                        console.print(f'ERROR: Tabla {tableName} está habilitada y no puede ser eliminada.', style=red)
-                        break
-        
+                    self._dropTable(file_path, tableName)
+
         if not found:
+            console.print(f'ERROR: No se encontarton tablas que coindican con el patron "{pattern}".', style=red)
+    
+    """
+    Función para describir una tabla en HBase
+    * tableName: Nombre de la tabla a describir
+    """
+    def describe(self, tableName):
+        file_path, data = self._findTable(tableName)
+
+        if file_path is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        metadata = data["metadata"]
+        hits, misses, hitRatio = self.blockCache.tableStats(tableName)
+        
+        table = PrettyTable()
+        table.field_names = ["Atributo", "Valor"]
+        
+        table.add_row(["Table Name", metadata["table_name"]])
+        table.add_row(["Column Families", ", ".join(metadata["column_families"])])
+        table.add_row(["Disabled", metadata["disabled"]])
+        table.add_row(["Created", metadata["created"]])
+        table.add_row(["Modified", metadata["modified"]])
+        table.add_row(["Versions", metadata.get("versions", "N/A")])
+        table.add_row(["Sequence", metadata.get("sequence", 0)])
+        table.add_row(["Storage", metadata.get("storage", "row")])
+        rowKey = metadata.get("row_key") or {"strategy": "uuid"}
+        rowKeyDescription = rowKey.get("strategy", "uuid")
+        if rowKey.get("columns"):
+            rowKeyDescription += f" ({', '.join(rowKey['columns'])})"
+        if rowKey.get("salt_buckets"):
+            rowKeyDescription += f", salt_buckets={rowKey['salt_buckets']}"
+        table.add_row(["Row Key", rowKeyDescription])
+        for cf in metadata["column_families"]:
+            settings = self._familySettings(metadata, cf)
+            ttl = f"{settings['ttl']}s" if settings['ttl'] else "FOREVER"
+            #Una tabla convertida a filas puede conservar la configuración de sus store files, pero no la usa
+            columnar = metadata.get("storage") == "columnar"
+            blockSize = settings['block_size'] if columnar else "N/A"
+            compression = settings['compression'] if columnar else "N/A"
+            table.add_row([f"Family {cf}", f"versions={settings['versions']}, block_size={blockSize}, compression={compression}, ttl={ttl}"])
+            if metadata.get("storage") == "columnar":
+                table.add_row([f"Compression Ratio {cf}", self._compressionRatio(file_path, metadata, cf)])
+        table.add_row(["Block Cache Hits", f"{hits}/{hits + misses} ({hitRatio:.1%})"])
+        table.add_row(["Coprocessors", ", ".join(type(observer).__name__ for observer in self.coprocessors.get(tableName, [])) or "N/A"])
+        
+        print(table)
+
+    """
+    Función para insertar o actualizar una fila dentro de una tabla en HBase
+    * tableName: Nombre de la tabla
+    * action: Acción a realizar (insertar o actualizar)
+    """
+    def put(self, tableName, action):
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
             console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        data = self._readTable(filePath, forUpdate=True)
+        data = self._loadRows(filePath, data, forUpdate=True)
+        data["metadata"]["modified"] = datetime.now().isoformat()
+        columnFamilies = data["metadata"]["column_families"]
+        events = []
+        putCells = None
+
+        if action == 'i':
+            row_data = {}
+            for cf in columnFamilies:
+                cf_data = {}
+                print(f"Column Family: {cf}")
+                properties = input(f"Ingrese las propiedades para {cf} separadas por comas: ").strip().split(',')
+                for prop in properties:
+                    value = input(f"Ingrese el valor para {prop}: ").strip()
+                    timestamp = datetime.now().isoformat()
+                    cf_data[prop] = {timestamp: value}
+                row_data[cf] = cf_data
+
+            #La row key se genera con la estrategia de la tabla una vez conocidos los valores de la fila
+            rowID = makeRowKey(data["metadata"].get("row_key"), row_data)
+            if not self._preHook(tableName, "prePut", rowID, row_data):
+                return
+            putCells = (rowID, row_data)
+            for cf, cf_data in row_data.items():
+                for prop, versions in cf_data.items():
+                    for timestamp, value in versions.items():
+                        events.append(self._event(tableName, "Put", rowID, f"{cf}:{prop}", timestamp, value))
+            data["rows_data"][rowID] = row_data
+            data["metadata"]["modified"] = datetime.now().isoformat()
+            console.print(f"SISTEMA: Fila insertada con row key {rowID}.", style=blue)
+            #data["metadata"]["rows_counter"] += 1
+
+        elif action == 'u':
+            rowID = input("Ingrese el ID de la fila a actualizar: ").strip()
+            if rowID in data["rows_data"]:
+                cells = {}
+                for cf in columnFamilies:
+                    if cf in data["rows_data"][rowID]:
+                        print(f"Column Family: {cf}")
+                        for prop in data["rows_data"][rowID][cf]:
+                            value = input(f"Ingrese el nuevo valor para {prop} (actual: {list(data['rows_data'][rowID][cf][prop].values())}): ").strip()
+                            cells.setdefault(cf, {})[prop] = {datetime.now().isoformat(): value}
+
+                if not self._preHook(tableName, "prePut", rowID, cells):
+                    return
+                putCells = (rowID, cells)
+
+                for cf, properties in cells.items():
+                    versions = self._familySettings(data["metadata"], cf)["versions"]
+                    for prop, newVersions in properties.items():
+                        for timestamp, value in newVersions.items():
+                            if prop in data["rows_data"][rowID][cf]:
+                                #Limit the number of versions stored
+                                if len(data["rows_data"][rowID][cf][prop]) >= versions:
+                                    oldest_timestamp = sorted(data["rows_data"][rowID][cf][prop])[0]
+                                    del data["rows_data"][rowID][cf][prop][oldest_timestamp]
+                                data["rows_data"][rowID][cf][prop][timestamp] = value
+                            else:
+                                data["rows_data"][rowID][cf][prop] = {timestamp: value}
+                            events.append(self._event(tableName, "Put", rowID, f"{cf}:{prop}", timestamp, value))
+                data["metadata"]["modified"] = datetime.now().isoformat()
+            else:
+                console.print(f"ERROR: No se encontró la fila con ID {rowID}.", style=red)
+        else:
+            console.print(f"Acción no válida. Use 'i' para insertar o 'u' para actualizar.", style=red)
+            return
+
+        #Guardar los cambios en el archivo JSON
+        self._commit(filePath, data, events)
+        if putCells is not None:
+            self._postHook(tableName, "postPut", *putCells)
+        console.print(f"SISTEMA: Operación realizada en la tabla {tableName}.", style=blue)
+
+    """
+    Función para insertar multiples filas dentro de una tabla en HBase
+    * tableName: Nombre de la tabla
+    """
+    def insertMany(self, tablename):
+        try:
+            while True:
+                self.put(tableName=tableName, action='i')
+                console.print("\nCRTL+C para terminar de insertar\n", style=red)
+        except KeyboardInterrupt:
+            print("\nFin de inserción multiple")
+        except Exception as e:
+            return e
+        
+        """
+    Función para actualizar multiples filas dentro de una tabla en HBase
+    * tableName: Nombre de la tabla
+    """
+    def updateMany(self, tablename):
+        try:
+            while True:
+                self.put(tableName=tableName, action='u')
+                console.print("\nCRTL+C para terminar de actualizar\n", style=red)
+        except KeyboardInterrupt:
+            print("\nFin de actualización multiple")
+        except Exception as e:
+            return e
+        
+        
+    """
+    Función para obtener los datos de una fila en una tabla de HBase
+    * tableName: Nombre de la tabla
+    * rowID: ID de la fila a obtener
+    * families: Lista de column families a obtener (None para todas)
+    """
+    def get(self, tableName, rowID, families=None):
+        filePath, data = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        if not self._checkFamilies(data, families):
+            return
+
+        if not self._preHook(tableName, "preGet", rowID, families):
+            return
+
+        rowData = self._getRow(filePath, data, rowID, families)
+        if rowData is not None:
+            rowData = self._postHook(tableName, "postGet", rowID, self._copyRow(rowData))
+        if rowData is None:
+            console.print(f'ERROR: Fila con ID {rowID} no encontrada en la tabla {tableName}.', style=red)
+            return
+        
+        table = PrettyTable()
+        headers = ["Row key"]
+        row = [rowID]
+        
+        for cf, properties in rowData.items():
+            for prop, values in properties.items():
+                headers.append(f"{cf}:{prop}")
+                latest_timestamp = max(values.keys())
+                row.append(values[latest_timestamp])
+        
+        table.field_names = headers
+        table.add_row(row)
+        
+        print(table)
+
+
+    """
+    Función para obtener varias filas de una tabla en HBase abriendo la tabla una sola vez
+    * tableName: Nombre de la tabla
+    * rowKeys: Lista de row keys a obtener
+    * columns: Lista de column families o columnas family:qualifier a obtener (None para todas)
+    """
+    def multiGet(self, tableName, rowKeys, columns=None):
+        filePath, data = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        families = None
+        qualifiers = {}
+        if columns:
+            families = []
+            for column in columns:
+                cf, _, qualifier = column.partition(':')
+                if cf not in families:
+                    families.append(cf)
+                if qualifier:
+                    qualifiers.setdefault(cf, set()).add(qualifier)
+
+        if not self._checkFamilies(data, families):
+            return
+
+        #Las filas que un observer no permite leer se devuelven como no encontradas
+        allowedKeys = [rowKey for rowKey in rowKeys if self._preHook(tableName, "preGet", rowKey, families)]
+        rowsData = self._getRows(filePath, data, allowedKeys, families)
+
+        #Devolver los resultados en el orden pedido, con None para las filas que no existen
+        results = []
+        for rowKey in rowKeys:
+            rowData = rowsData.get(rowKey)
+            if rowData is not None:
+                rowData = self._postHook(tableName, "postGet", rowKey, self._copyRow(rowData))
+            if rowData is not None and qualifiers:
+                rowData = {cf: {prop: values for prop, values in properties.items() if cf not in qualifiers or prop in qualifiers[cf]}
+                           for cf, properties in rowData.items()}
+            results.append(rowData)
+
+        headers = ["Row key"]
+        for rowData in results:
+            for cf, properties in (rowData or {}).items():
+                for prop in properties:
+                    if f"{cf}:{prop}" not in headers:
+                        headers.append(f"{cf}:{prop}")
+
+        table = PrettyTable()
+        table.field_names = headers
+        missing = []
+        for rowKey, rowData in zip(rowKeys, results):
+            if rowData is None:
+                missing.append(rowKey)
+                continue
+            row = [rowKey] + [""] * (len(headers) - 1)
+            for cf, properties in rowData.items():
+                for prop, values in properties.items():
+                    row[headers.index(f"{cf}:{prop}")] = values[max(values)] if values else ""
+            table.add_row(row)
+
+        print(table)
+        if missing:
+            console.print(f'ERROR: Filas no encontradas en la tabla {tableName}: {", ".join(missing)}', style=red)
+        return results
+
+    """
+    Función para escanear una tabla en HBase, mostrando la primera página de filas
+    * tableName: Nombre de la tabla a escanear
+    * cacheBlocks: False para no llenar la caché de bloques con un scan de una sola vez
+    * families: Lista de column families a escanear (None para todas)
+    * startRow: Primera row key incluida, sin prefijo de sal (opcional)
+    * stopRow: Row key donde se detiene el scan, no incluida, sin prefijo de sal (opcional)
+    * pageSize: Número de filas por página, las siguientes se obtienen con nextPage
+    """
+    def scan(self, tableName, cacheBlocks=True, families=None, startRow=None, stopRow=None, pageSize=DEFAULT_PAGE_SIZE):
+        if pageSize < 1:
+            console.print('ERROR: El número de filas por página debe ser mayor que 0.', style=red)
+            return
+
+        filePath, data = self._findTable(tableName, cacheBlocks)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        if not self._checkFamilies(data, families):
+            return
+
+        if not self._preHook(tableName, "preScan", families, startRow, stopRow):
+            return
+
+        #Un scan nuevo cierra el cursor anterior y sus store files
+        if self.scanner is not None:
+            self.scanner.close()
+        #El cursor conserva la versión de la tabla leída y sus store files abiertos: todas sus páginas
+        #muestran las celdas confirmadas hasta ese read point, aunque otros procesos sigan escribiendo
+        rows, readers = self._scanRows(filePath, data, families, cacheBlocks, startRow=startRow, stopRow=stopRow)
+        self.scanner = Scanner(tableName, rows, readers, pageSize, data["metadata"].get("sequence", 0))
+
+        return self.nextPage()
+
+    """
+    Función para mostrar la siguiente página del último scan
+    """
+    def nextPage(self):
+        if self.scanner is None or self.scanner.exhausted:
+            console.print('SISTEMA: No hay un scan abierto, use scan para iniciar uno.', style=blue)
+            return
+
+        scanner = self.scanner
+        #Los observers y quien recibe la página trabajan sobre copias, no sobre los bloques en caché
+        pageRows = {rowKey: self._copyRow(rowData) for rowKey, rowData in scanner.nextPage().items()}
+        pageRows = self._postHook(scanner.tableName, "postScan", pageRows)
+
+        #Agrupar las filas de la página por sus propiedades, los encabezados de cada grupo se calculan una vez por scan
+        groupedRows = {}
+        for rowID, rowData in pageRows.items():
+            signature, headers = scanner.headersFor(rowData)
+            if signature not in groupedRows:
+                groupedRows[signature] = PrettyTable()
+                groupedRows[signature].field_names = headers
+
+            row = [rowID]
+            for cf, properties in rowData.items():
+                for prop, values in properties.items():
+                    if values:
+                        latestTimestamp = max(values.keys())
+                        cellValue = f"{latestTimestamp}\n{values[latestTimestamp]}"
+                    else:
+                        cellValue = ""
+                    row.append(cellValue)
+            groupedRows[signature].add_row(row, divider=True)
+
+        #Imprimir los grupos de filas
+        for rowTable in groupedRows.values():
+            print(rowTable)
+
+        if scanner.exhausted:
+            console.print(f'SISTEMA: Fin del scan de la tabla {scanner.tableName}, {scanner.rowsRead} filas (read point {scanner.readPoint}).', style=blue)
+        else:
+            console.print(f'SISTEMA: {scanner.rowsRead} filas mostradas de la tabla {scanner.tableName} (read point {scanner.readPoint}). Escriba next para ver la siguiente página.', style=blue)
+        return pageRows
+
+
+    """
+    Función para eliminar una celda, una fila o una familia de columnas en una tabla de HBase
+    * tableName: Nombre de la tabla
+    """
+    def delete(self, tableName, action):
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        data = self._readTable(filePath, forUpdate=True)
+        data = self._loadRows(filePath, data, forUpdate=True)
+        data["metadata"]["modified"] = datetime.now().isoformat()
+        events = []
+        
+        if action == 'c':
+            rowKey = input("Ingrese la row key: ").strip()
+            columnFamily = input("Ingrese la column family: ").strip()
+            qualifier = input("Ingrese el qualifier: ").strip()
+            
+            if rowKey in data["rows_data"]:
+                if columnFamily in data["rows_data"][rowKey]:
+                    if qualifier in data["rows_data"][rowKey][columnFamily]:
+                        if not self._preHook(tableName, "preDelete", rowKey, f"{columnFamily}:{qualifier}"):
+                            return
+                        del data["rows_data"][rowKey][columnFamily][qualifier]
+                        if not data["rows_data"][rowKey][columnFamily]:
+                            del data["rows_data"][rowKey][columnFamily]
+                        events.append(self._event(tableName, "DeleteColumn", rowKey, f"{columnFamily}:{qualifier}"))
+                        console.print(f'SISTEMA: Celda eliminada {rowKey} - {columnFamily}:{qualifier}', style=blue)
+                    else:
+                        console.print(f'ERROR: No se encontró el qualifier {qualifier} en la column family {columnFamily}.', style=red)
+                else:
+                    console.print(f'ERROR: No se encontró la column family {columnFamily} en la fila {rowKey}.', style=red)
+            else:
+                console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
+        
+        elif action == 'r':
+            rowKey = input("Ingrese la row key: ").strip()
+            
+            if rowKey in data["rows_data"]:
+                if not self._preHook(tableName, "preDelete", rowKey, None):
+                    return
+                del data["rows_data"][rowKey]
+                events.append(self._event(tableName, "DeleteRow", rowKey))
+                console.print(f'SISTEMA: Fila eliminada {rowKey}', style=blue)
+            else:
+                console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
+        
+        elif action == 'f':
+            rowKey = input("Ingrese la row key: ").strip()
+            columnFamily = input("Ingrese la column family: ").strip()
+            
+            if rowKey in data["rows_data"]:
+                if columnFamily in data["rows_data"][rowKey]:
+                    if not self._preHook(tableName, "preDelete", rowKey, columnFamily):
+                        return
+                    del data["rows_data"][rowKey][columnFamily]
+                    events.append(self._event(tableName, "DeleteFamily", rowKey, columnFamily))
+                    console.print(f'SISTEMA: Column family eliminada {rowKey} - {columnFamily}', style=blue)
+                else:
+                    console.print(f'ERROR: No se encontró la column family {columnFamily} en la fila {rowKey}.', style=red)
+            else:
+                console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
+        
+        else:
+            print("Acción no válida. Use 'c' para eliminar una celda, 'r' para eliminar una fila o 'f' para eliminar una familia de columnas.")
+        
+        #Guardar los cambios en el archivo JSON
+        self._commit(filePath, data, events)
+        for event in events:
+            self._postHook(tableName, "postDelete", event["row"], event["column"])
+
+    """
+    Función para eliminar una fila en una tabla de HBase
+    * tableName: Nombre de la tabla
+    * rowKey: ID de la fila a eliminar
+    """
+    def delete_all(self, tableName, rowKey):
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        data = self._readTable(filePath, forUpdate=True)
+        data = self._loadRows(filePath, data, forUpdate=True)
+        data["metadata"]["modified"] = datetime.now().isoformat()
+        
+        if rowKey in data["rows_data"]:
+            if not self._preHook(tableName, "preDelete", rowKey, None):
+                return
+            del data["rows_data"][rowKey]
+            console.print(f'SISTEMA: Fila eliminada {rowKey}', style=blue)
+            
+            #Guardar los cambios en el archivo JSON
+            self._commit(filePath, data, [self._event(tableName, "DeleteRow", rowKey)])
+            self._postHook(tableName, "postDelete", rowKey, None)
+        else:
+            console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
+
+    """
+    Función para contar las filas de una tabla en HBase
+    * tableName: Nombre de la tabla
+    * startRow: Primera row key incluida, sin prefijo de sal (opcional)
+    * stopRow: Row key donde se detiene el conteo, no incluida, sin prefijo de sal (opcional)
+    """
+    def count(self, tableName, startRow=None, stopRow=None):
+        filePath, data = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        #Contar las filas es un scan de la tabla, los observers pueden rechazarlo
+        if not self._preHook(tableName, "preScan", None, startRow, stopRow):
+            return
+
+        row_count = len(self._loadRows(filePath, data, startRow=startRow, stopRow=stopRow)["rows_data"])
+        console.print(f'Cantidad de filas en la tabla {tableName}: {row_count}', style=green)
+
+    """
+    Función para calcular agregaciones sobre la última versión de una columna en HBase
+    * tableName: Nombre de la tabla
+    * column: Columna a agregar con formato family:qualifier
+    * functions: Lista de agregaciones a calcular (None para todas las de AGGREGATIONS)
+    * groupBy: Columna con formato family:qualifier por la cual agrupar (opcional)
+    * startRow: Primera row key incluida (opcional)
+    * stopRow: Row key donde se detiene la lectura, no incluida (opcional)
+    """
+    def aggregate(self, tableName, column, functions=None, groupBy=None, startRow=None, stopRow=None):
+        filePath, data = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        functions = functions or AGGREGATIONS
+        for function in functions:
+            if function not in AGGREGATIONS:
+                console.print(f'ERROR: Agregación {function} no válida. Use una de: {", ".join(AGGREGATIONS)}.', style=red)
+                return
+
+        if ':' not in column or (groupBy and ':' not in groupBy):
+            console.print('ERROR: Las columnas deben tener el formato family:qualifier.', style=red)
+            return
+
+        cf, qualifier = column.split(':', 1)
+        families = [cf]
+        if groupBy:
+            groupCf, groupQualifier = groupBy.split(':', 1)
+            if groupCf != cf:
+                families.append(groupCf)
+
+        if not self._checkFamilies(data, families):
+            return
+
+        if not self._preHook(tableName, "preScan", families, startRow, stopRow):
+            return
+
+        #Recorrer solo las column families necesarias dentro del rango de row keys, fila por fila,
+        #y decodificar la última versión de cada celda en vectores
+        rows, readers = self._scanRows(filePath, data, families, startRow=startRow, stopRow=stopRow)
+        values = []
+        groups = []
+        try:
+            for _, rowData in rows:
+                cells = rowData.get(cf, {}).get(qualifier)
+                if not cells:
+                    continue
+                if groupBy:
+                    groupCells = rowData.get(groupCf, {}).get(groupQualifier)
+                    if not groupCells:
+                        continue
+                    groups.append(groupCells[max(groupCells)])
+                values.append(cells[max(cells)])
+        finally:
+            for reader in readers:
+                reader.close()
+
+        if not values:
+            console.print(f'SISTEMA: No hay celdas {column} en el rango indicado de la tabla {tableName}.', style=blue)
+            return {}
+
+        if groupBy:
+            groupKeys, inverse = np.unique(np.array(groups), return_inverse=True)
+        else:
+            groupKeys = np.array([tableName])
+            inverse = np.zeros(len(values), dtype=np.intp)
+
+        #Agregar todos los grupos a la vez sobre los vectores
+        results = {"count": np.bincount(inverse, minlength=len(groupKeys))}
+        if any(function != "count" for function in functions):
+            try:
+                vector = np.array(values, dtype=np.float64)
+            except ValueError:
+                console.print(f'ERROR: La columna {column} tiene valores no numéricos, solo se puede usar count.', style=red)
+                return
+
+            results["sum"] = np.bincount(inverse, weights=vector, minlength=len(groupKeys))
+            results["avg"] = results["sum"] / results["count"]
+            results["min"] = np.full(len(groupKeys), np.inf)
+            np.minimum.at(results["min"], inverse, vector)
+            results["max"] = np.full(len(groupKeys), -np.inf)
+            np.maximum.at(results["max"], inverse, vector)
+
+        table = PrettyTable()
+        table.field_names = [groupBy or "Tabla"] + [f"{function}({column})" for function in functions]
+        aggregated = {}
+        for position, groupKey in enumerate(groupKeys.tolist()):
+            aggregated[groupKey] = {function: results[function][position].item() for function in functions}
+            table.add_row([groupKey] + [round(aggregated[groupKey][function], 4) for function in functions])
+
+        print(table)
+        return aggregated
+
+    """
+    Función para truncar las filas de una tabla en HBase
+    * tableName: Nombre de la tabla
+    """
+    def truncate(self, tableName):
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        console.print(f'SISTEMA: Tabla {tableName} ha sido deshabilitada.\n', style=blue)
+        
+        console.print('Eliminando todas las filas...', style=green)
+        barColor = "\033[32m"
+        for _ in tqdm(range(100), desc="Progreso", ncols=100, bar_format=f"{barColor}{{bar}}\033[00m"):
+            time.sleep(0.03)  # Simulación de carga
+        
+        #La tabla se lee bajo el bloqueo después de la barra de progreso, así no se sobrescriben escrituras confirmadas durante la espera
+        with self._tableLock(filePath):
+            data = self._readTable(filePath, forUpdate=True)
+            data["metadata"]["modified"] = datetime.now().isoformat()
+            data["metadata"]["disabled"] = True
+            data["rows_data"] = {}
+            data["metadata"]["rows_counter"] = 0
+            
+            self._writeTable(filePath, data)
+            self.changeLog.append([self._event(tableName, "Truncate")])
+        
+        console.print(f'\nSISTEMA: Todas las filas de la tabla {tableName} han sido eliminadas.', style=blue)
+
+
+    """
+    Función para consultar el registro de cambios a partir de un número de secuencia
+    * fromSequence: Último número de secuencia ya consumido, se muestran los eventos posteriores
+    * limit: Número máximo de eventos a mostrar
+    * tableName: Nombre de la tabla para filtrar los eventos (opcional)
+    """
+    def changes(self, fromSequence=0, limit=100, tableName=None):
+        consumer = ChangeLogConsumer(self.changeLog, fromSequence)
+        events = [event for event in consumer.poll(limit) if tableName is None or event["table"] == tableName]
+
+        table = PrettyTable()
+        table.field_names = ["Seq", "Tabla", "Tipo", "Row key", "Columna", "Timestamp", "Valor"]
+        for event in events:
+            table.add_row([event["seq"], event["table"], event["type"], event["row"] or "", event["column"] or "", event["timestamp"], event["value"] if event["value"] is not None else ""])
+
+        print(table)
+        console.print(f'SISTEMA: Último número de secuencia leído: {consumer.sequence}', style=blue)
+        return events
+
+    """
+    Función para eliminar físicamente las celdas expiradas por TTL de una tabla
+    * filePath: Ruta del archivo JSON de la tabla
+    """
+    def _compact(self, filePath):
+        #Las réplicas no reescriben sus tablas, las celdas expiradas ya se ocultan al leer
+        if self.primary is not None:
+            return 0
+
+        data = self._readTable(filePath, forUpdate=True)
+        sequence = data["metadata"].get("sequence", 0)
+        cutoffs = self._ttlCutoffs(data["metadata"])
+        if not cutoffs:
+            return 0
+
+        data = self._loadRows(filePath, data, forUpdate=True, applyTtl=False)
+        removed = 0
+        rowsData = {}
+        for rowKey, rowData in data["rows_data"].items():
+            live = self._liveRow(rowData, None, cutoffs)
+            removed += self._countVersions(rowData) - self._countVersions(live)
+            if live:
+                rowsData[rowKey] = live
+
+        if removed == 0:
+            return 0
+
+        #Si la tabla cambió mientras se compactaba, la compactación se omite y se intenta en la siguiente pasada
+        with self._tableLock(filePath):
+            if self._readTable(filePath, forUpdate=True)["metadata"].get("sequence", 0) != sequence:
+                return 0
+            data["rows_data"] = rowsData
+            self._writeTable(filePath, data, set(cutoffs))
+        return removed
+
+    """
+    Función para eliminar los store files reemplazados de una tabla una vez pasado el tiempo de gracia,
+    sin esperar a la siguiente escritura de la tabla
+    * filePath: Ruta del archivo JSON de la tabla
+    """
+    def _purgeStoreFiles(self, filePath):
+        storeDirectory = self._storeDirectory(filePath)
+        if not os.path.isdir(storeDirectory):
+            return 0
+
+        #Bajo el bloqueo ninguna escritura ni restauración puede volver a referenciar los archivos eliminados.
+        #En una réplica las tablas se escriben al aplicar los eventos del primario, bajo el lock de replicación
+        removed = 0
+        replicationLock = self.replicationLock if self.primary is not None else nullcontext()
+        with replicationLock, self._tableLock(filePath):
+            metadata = self._readTable(filePath, forUpdate=True)["metadata"]
+            live = {family.get("store_file") for family in metadata.get("families", {}).values()}
+            now = time.time()
+            for storeFile, replaced in metadata.get("obsolete_store_files", {}).items():
+                path = os.path.join(storeDirectory, storeFile)
+                if now - replaced >= OBSOLETE_GRACE and storeFile not in live and os.path.exists(path):
+                    os.remove(path)
+                    self.blockCache.evictFile(path)
+                    removed += 1
+        #Las entradas quedan en los metadatos hasta la siguiente escritura, que las descarta
+        return removed
+
+    #Cuenta las versiones de celda guardadas en una fila
+    def _countVersions(self, rowData):
+        return sum(len(versions) for cells in rowData.values() for versions in cells.values())
+
+    """
+    Función para compactar una tabla en HBase, eliminando las celdas expiradas por TTL
+    * tableName: Nombre de la tabla
+    """
+    def major_compact(self, tableName):
+        if not self._checkWritable():
+            return
+
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        removed = self._compact(filePath)
+        purged = self._purgeStoreFiles(filePath)
+        console.print(f'SISTEMA: Tabla {tableName} compactada, {removed} versiones de celda expiradas y {purged} store files reemplazados eliminados.', style=blue)
+
+    """
+    Función para iniciar la purga en segundo plano de las celdas expiradas de todas las tablas
+    * interval: Segundos entre cada pasada de purga
+    """
+    def startPurgeThread(self, interval=300):
+        def purge():
+            while True:
+                time.sleep(interval)
+                for file in os.listdir(self.directory):
+                    if file.endswith('.json'):
+                        try:
+                            self._compact(os.path.join(self.directory, file))
+                            self._purgeStoreFiles(os.path.join(self.directory, file))
+                        except Exception:
+                            #Un error en una tabla no debe detener la purga del resto
+                            continue
+
+        thread = threading.Thread(target=purge, daemon=True)
+        thread.start()
+        return thread
+
+    """
+    Función para tomar un snapshot de una tabla en HBase
+    * tableName: Nombre de la tabla
+    * snapshotName: Nombre del snapshot
+    """
+    def snapshot(self, tableName, snapshotName):
+        filePath, _ = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        snapshotDirectory = self._snapshotDirectory(snapshotName)
+        if not snapshotName or os.path.exists(snapshotDirectory):
+            console.print(f'ERROR: El snapshot "{snapshotName}" no es válido o ya existe.', style=red)
+            return
+
+        os.makedirs(os.path.join(snapshotDirectory, 'families'))
+        tablePath = os.path.join(snapshotDirectory, 'table.json')
+
+        #Los archivos de la tabla nunca se modifican en su lugar, por lo que basta con enlazarlos.
+        #Si una escritura reemplaza un store file mientras se enlaza, se vuelve a intentar
+        #desde cero, sin conservar enlaces de intentos fallidos que el manifiesto no lista.
+        for _ in range(5):
+            if os.path.exists(tablePath):
+                os.remove(tablePath)
+            shutil.rmtree(os.path.join(snapshotDirectory, 'families'))
+            os.makedirs(os.path.join(snapshotDirectory, 'families'))
+            self._linkFile(filePath, tablePath)
+            with open(tablePath, 'r') as f:
+                metadata = json.load(f)["metadata"]
+
+            storeFiles = {}
+            try:
+                for cf, family in metadata.get("families", {}).items():
+                    if metadata.get("storage") == "columnar" and family.get("store_file"):
+                        target = os.path.join(snapshotDirectory, 'families', family["store_file"])
+                        self._linkFile(os.path.join(self._storeDirectory(filePath), family["store_file"]), target)
+                        storeFiles[cf] = family["store_file"]
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            shutil.rmtree(snapshotDirectory)
+            console.print(f'ERROR: La tabla {tableName} cambió durante el snapshot, intente de nuevo.', style=red)
+            return
+
+        manifest = {
+            "snapshot_name": snapshotName,
+            "table_name": tableName,
+            "file_name": os.path.basename(filePath),
+            "storage": metadata.get("storage", "row"),
+            "store_files": storeFiles,
+            "created": datetime.now().isoformat()
+        }
+        with open(os.path.join(snapshotDirectory, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=4)
+
+        console.print(f'SISTEMA: Snapshot {snapshotName} de la tabla {tableName} creado.', style=blue)
+
+    """
+    Función para listar los snapshots en HBase
+    """
+    def list_snapshots(self):
+        snapshotsTable = PrettyTable()
+        snapshotsTable.field_names = ["Snapshot", "Tabla", "Storage", "Created"]
+
+        snapshotsDirectory = os.path.join(self.directory, SNAPSHOT_DIRECTORY)
+        if os.path.isdir(snapshotsDirectory):
+            for snapshotName in sorted(os.listdir(snapshotsDirectory)):
+                manifest = self._readSnapshot(snapshotName)
+                if manifest is not None:
+                    snapshotsTable.add_row([snapshotName, manifest["table_name"], manifest["storage"], manifest["created"]])
+
+        print(snapshotsTable)
+
+    """
+    Función para crear una tabla nueva a partir de un snapshot
+    * snapshotName: Nombre del snapshot
+    * newTableName: Nombre de la tabla nueva
+    """
+    def clone_snapshot(self, snapshotName, newTableName):
+        if not self._checkWritable():
+            return
+
+        manifest = self._readSnapshot(snapshotName)
+
+        if manifest is None:
+            console.print(f'ERROR: Snapshot {snapshotName} no encontrado.', style=red)
+            return
+
+        filePath = os.path.join(self.directory, newTableName + '.json')
+        if not newTableName or self._findTable(newTableName)[0] is not None:
+            console.print(f'ERROR: La tabla {newTableName} no es válida o ya existe.', style=red)
+            return
+
+        with self._tableLock(filePath):
+            #Otro proceso pudo crear el archivo mientras se esperaba el bloqueo
+            if os.path.exists(filePath):
+                console.print(f'ERROR: La tabla {newTableName} no es válida o ya existe.', style=red)
+                return
+
+            snapshotDirectory = self._snapshotDirectory(snapshotName)
+            with open(os.path.join(snapshotDirectory, 'table.json'), 'r') as f:
+                data = json.load(f)
+
+            #Los store files se comparten con el snapshot hasta que la tabla nueva los reescriba
+            if manifest["storage"] == "columnar":
+                storeDirectory = self._storeDirectory(filePath)
+                os.makedirs(storeDirectory, exist_ok=True)
+                for storeFile in manifest["store_files"].values():
+                    self._linkFile(os.path.join(snapshotDirectory, 'families', storeFile), os.path.join(storeDirectory, storeFile))
+
+            data["metadata"]["table_name"] = newTableName
+            data["metadata"]["disabled"] = False
+            data["metadata"]["created"] = datetime.now().isoformat()
+            data["metadata"]["modified"] = datetime.now().isoformat()
+
+            #Una tabla eliminada pudo usar este archivo, la secuencia continúa después del último evento registrado
+            #para que un escritor que la leyó no pase la verificación de _commit
+            data["metadata"]["sequence"] = max(data["metadata"].get("sequence", 0), self.changeLog.lastSequence())
+            self._writeTable(filePath, data)
+            self.changeLog.append([self._event(newTableName, "Clone", file_name=os.path.basename(filePath), snapshot_name=snapshotName)])
+
+        console.print(f'SISTEMA: Tabla {newTableName} creada a partir del snapshot {snapshotName}.', style=blue)
+
+    """
+    Función para restaurar una tabla al contenido de un snapshot
+    * snapshotName: Nombre del snapshot
+    """
+    def restore_snapshot(self, snapshotName):
+        if not self._checkWritable():
+            return
+
+        manifest = self._readSnapshot(snapshotName)
+
+        if manifest is None:
+            console.print(f'ERROR: Snapshot {snapshotName} no encontrado.', style=red)
+            return
+
+        tableName = manifest["table_name"]
+        filePath = os.path.join(self.directory, manifest["file_name"])
+        snapshotDirectory = self._snapshotDirectory(snapshotName)
+        snapshotTable = os.path.join(snapshotDirectory, 'table.json')
+
+        with self._tableLock(filePath):
+            current = self._readTable(filePath, cacheBlocks=False)["metadata"] if os.path.exists(filePath) else {}
+            if current and not current["disabled"]:
+                console.print(f'ERROR: Tabla {tableName} está habilitada y no puede ser restaurada.', style=red)
+                return
+
+            with open(snapshotTable, 'r') as f:
+                data = json.load(f)
+
+            #La secuencia continúa después de la mayor entre la tabla actual y el snapshot, así nunca se repite
+            #un número ya usado y un escritor que leyó la tabla antes de restaurarla no pasa la verificación de _commit
+            data["metadata"]["sequence"] = max(current.get("sequence", 0), data["metadata"].get("sequence", 0))
+
+            if manifest["storage"] == "columnar":
+                storeDirectory = self._storeDirectory(filePath)
+                os.makedirs(storeDirectory, exist_ok=True)
+                for storeFile in manifest["store_files"].values():
+                    target = os.path.join(storeDirectory, storeFile)
+                    if not os.path.exists(target):
+                        self._linkFile(os.path.join(snapshotDirectory, 'families', storeFile), target)
+
+                #Continuar la secuencia de store files para no reutilizar nombres de archivos existentes
+                data["metadata"]["store_sequence"] = max(current.get("store_sequence", 0), data["metadata"].get("store_sequence", 0))
+                self._writeTable(filePath, data)
+
+                for storeFile in os.listdir(storeDirectory):
+                    if storeFile not in manifest["store_files"].values():
+                        os.remove(os.path.join(storeDirectory, storeFile))
+                        self.blockCache.evictFile(os.path.join(storeDirectory, storeFile))
+            else:
+                #El archivo se reescribe en lugar de enlazarlo al del snapshot para guardar la nueva secuencia
+                self._writeTable(filePath, data)
+                self._dropStore(filePath)
+            self.changeLog.append([self._event(tableName, "Restore", file_name=manifest["file_name"], snapshot_name=snapshotName)])
+
+        console.print(f'SISTEMA: Tabla {tableName} restaurada al snapshot {snapshotName}.', style=blue)
+
+    """
+    Función para eliminar un snapshot
+    * snapshotName: Nombre del snapshot
+    """
+    def delete_snapshot(self, snapshotName):
+        if self._readSnapshot(snapshotName) is None:
+            console.print(f'ERROR: Snapshot {snapshotName} no encontrado.', style=red)
+            return
+
+        shutil.rmtree(self._snapshotDirectory(snapshotName))
+        console.print(f'SISTEMA: Snapshot {snapshotName} eliminado.', style=blue)
+
+    """
+    Función para registrar un observer en una tabla
+    * tableName: Nombre de la tabla
+    * observer: Instancia de RegionObserver cuyos hooks se ejecutan en put, delete, get y scan
+    """
+    def addCoprocessor(self, tableName, observer):
+        if self._findTable(tableName)[0] is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+        self.coprocessors.setdefault(tableName, []).append(observer)
+        console.print(f'SISTEMA: Coprocesador {type(observer).__name__} registrado en la tabla {tableName}.', style=blue)
+
+    """
+    Función para quitar todos los observers de una tabla
+    * tableName: Nombre de la tabla
+    """
+    def removeCoprocessors(self, tableName):
+        removed = self.coprocessors.pop(tableName, [])
+        console.print(f'SISTEMA: {len(removed)} coprocesadores eliminados de la tabla {tableName}.', style=blue)
+
+    """
+    Función para registrar un endpoint que se puede ejecutar sobre las filas de cualquier tabla
+    * name: Nombre del endpoint
+    * function: Función que recibe un iterador de (rowKey, datos de la fila) y devuelve el resultado reducido
+    """
+    def registerEndpoint(self, name, function):
+        self.endpoints[name] = function
+
+    """
+    Función para ejecutar un endpoint sobre las filas de una tabla y devolver solo su resultado
+    * tableName: Nombre de la tabla
+    * endpointName: Nombre del endpoint
+    * args: Argumentos adicionales del endpoint, p. ej. la columna family:qualifier
+    * families: Lista de column families a leer (None para todas)
+    * startRow: Primera row key incluida, sin prefijo de sal (opcional)
+    * stopRow: Row key donde se detiene la lectura, no incluida, sin prefijo de sal (opcional)
+    """
+    def execEndpoint(self, tableName, endpointName, *args, families=None, startRow=None, stopRow=None):
+        filePath, data = self._findTable(tableName)
+
+        if filePath is None:
+            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+            return
+
+        if endpointName not in self.endpoints:
+            console.print(f'ERROR: Endpoint {endpointName} no válido. Use uno de: {", ".join(self.endpoints)}.', style=red)
+            return
+
+        if not self._checkFamilies(data, families):
+            return
+
+        if not self._preHook(tableName, "preScan", families, startRow, stopRow):
+            return
+
+        #Las filas se recorren una a una dentro del motor, sin pasar por la caché ni construir tablas para imprimir
+        rows, readers = self._scanRows(filePath, data, families, cacheBlocks=False, startRow=startRow, stopRow=stopRow)
+        try:
+            #El endpoint recibe copias de las filas, así no puede alterar los bloques compartidos de la caché
+            result = self.endpoints[endpointName](((rowKey, self._copyRow(rowData)) for rowKey, rowData in rows), *args)
+        finally:
+            for reader in readers:
+                reader.close()
+
+        console.print(f'Resultado de {endpointName} en la tabla {tableName}: {result}', style=green)
+        return result
 
     """
-    Función para eliminar todas las tablas que coincidan con un patrón
-    * pattern: Patrón de las tablas a eliminar
+    Función para copiar una tabla del primario enlazando sus archivos, sin copiar las filas
+    * sourcePath: Ruta del archivo JSON de la tabla en el primario
+    * targetPath: Ruta del archivo JSON de la tabla en la réplica
     """
-    def drop_all(self, pattern):
-        found = False
+    def _copyTable(self, sourcePath, targetPath):
+        tempPath = self._tempPath(targetPath)
+        targetStore = self._storeDirectory(targetPath)
 
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                file_path = os.path.join(self.directory, file)
+        #Si una escritura del primario reemplaza un store file mientras se enlaza, se vuelve a intentar
+        for _ in range(5):
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            self._linkFile(sourcePath, tempPath)
+            with open(tempPath, 'r') as f:
+                metadata = json.load(f)["metadata"]
 
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                tableName = data["metadata"]["table_name"]
+            storeFiles = []
+            if metadata.get("storage") == "columnar":
+                storeFiles = [family["store_file"] for family in metadata.get("families", {}).values() if family.get("store_file")]
+            try:
+                for storeFile in storeFiles:
+                    source = os.path.join(self._storeDirectory(sourcePath), storeFile)
+                    target = os.path.join(targetStore, storeFile)
+                    os.makedirs(targetStore, exist_ok=True)
+                    #La réplica pudo escribir su propio store file con el mismo nombre
+                    if os.path.exists(target) and os.path.samefile(source, target):
+                        continue
+                    self._linkFile(source, self._tempPath(target))
+                    os.replace(self._tempPath(target), target)
+                    self.blockCache.evictFile(target)
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            os.remove(tempPath)
+            raise RuntimeError(f"La tabla {sourcePath} cambió durante la copia")
 
-                if fnmatch.fnmatch(tableName, pattern):
-                    found = True
-                    if data["metadata"]["disabled"]:
-                        try:
-                            os.remove(file_path)
-                            console.print(f"SISTEMA: Tabla {tableName} ha sido eliminada.", style=blue)
-                        except PermissionError:
-                            console.print(f'EROR: No se puede eliminar la tabla {tableName} pues el archivo está en uso.', style=red)
-                    else:
-                        console.print(f'ERROR: Tabla {tableName} está habilitada y no puede ser eliminada.', style=red)
+        os.replace(tempPath, targetPath)
+        self.blockCache.evictFile(targetPath)
+
+        if os.path.isdir(targetStore):
+            for storeFile in os.listdir(targetStore):
+                if storeFile not in storeFiles:
+                    os.remove(os.path.join(targetStore, storeFile))
+                    self.blockCache.evictFile(os.path.join(targetStore, storeFile))
 
-        if not found:
-            console.print(f'ERROR: No se encontarton tablas que coindican con el patron "{pattern}".', style=red)
-    
     """
-    Función para describir una tabla en HBase
-    * tableName: Nombre de la tabla a describir
+    Función para leer el estado de replicación de la réplica
     """
-    def describe(self, tableName):
-        found = False
+    def _readReplicationState(self):
+        statePath = os.path.join(self.directory, REPLICATION_FILE)
+        if not os.path.exists(statePath):
+            return None
+        with open(statePath, 'r') as f:
+            return json.load(f)
 
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                file_path = os.path.join(self.directory, file)
-                
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    if data["metadata"]["table_name"] == tableName:
-                        found = True
-                        metadata = data["metadata"]
-                        
-                        table = PrettyTable()
-                        table.field_names = ["Atributo", "Valor"]
-                        
-                        table.add_row(["Table Name", metadata["table_name"]])
-                        table.add_row(["Column Families", ", ".join(metadata["column_families"])])
-                        table.add_row(["Disabled", metadata["disabled"]])
-                        table.add_row(["Created", metadata["created"]])
-                        table.add_row(["Modified", metadata["modified"]])
-                        table.add_row(["Versions", metadata.get("versions", "N/A")])
-                        
-                        print(table)
-                        break
-        
-        if not found:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+    """
+    Función para guardar el último número de secuencia aplicado por la réplica
+    * sequence: Último número de secuencia aplicado
+    * lastTimestamp: Timestamp del último evento aplicado
+    """
+    def _writeReplicationState(self, sequence, lastTimestamp=None):
+        statePath = os.path.join(self.directory, REPLICATION_FILE)
+        state = {
+            "primary": os.path.abspath(self.primary),
+            "applied_sequence": sequence,
+            "last_event_timestamp": lastTimestamp,
+            "updated": datetime.now().isoformat()
+        }
+        tempPath = self._tempPath(statePath)
+        with open(tempPath, 'w') as f:
+            json.dump(state, f, indent=4)
+        os.replace(tempPath, statePath)
 
     """
-    Función para insertar o actualizar una fila dentro de una tabla en HBase
-    * tableName: Nombre de la tabla
-    * action: Acción a realizar (insertar o actualizar)
+    Función para inicializar la réplica con una copia de todas las tablas del primario
     """
-    def put(self, tableName, action):
-        found = False
-        for file in os.listdir(self.directory):
+    def _bootstrapReplica(self):
+        #El número de secuencia se lee antes de copiar, así los eventos que ocurran durante la copia
+        #se vuelven a aplicar después y la réplica converge al estado del primario
+        sequence = self.primaryLog.lastSequence()
+
+        primaryTables = set()
+        for file in os.listdir(self.primary):
             if file.endswith('.json'):
+                try:
+                    self._copyTable(os.path.join(self.primary, file), os.path.join(self.directory, file))
+                    primaryTables.add(file)
+                except FileNotFoundError:
+                    #La tabla se eliminó durante la copia, su evento Drop llegará con la replicación
+                    continue
+
+        for file in os.listdir(self.directory):
+            if file.endswith('.json') and file not in primaryTables:
                 filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    data["metadata"]["modified"] = datetime.now().isoformat()
-                    found = True
-                    columnFamilies = data["metadata"]["column_families"]
-                    versions = data["metadata"].get("versions", 3)  #Default to 3 if versions not specified
-
-                    if action == 'i':
-                        rowID = str(uuid.uuid4())
-                        row_data = {}
-                        for cf in columnFamilies:
-                            cf_data = {}
-                            print(f"Column Family: {cf}")
-                            properties = input(f"Ingrese las propiedades para {cf} separadas por comas: ").strip().split(',')
-                            for prop in properties:
-                                value = input(f"Ingrese el valor para {prop}: ").strip()
-                                timestamp = datetime.now().isoformat()
-                                cf_data[prop] = {timestamp: value}
-                            row_data[cf] = cf_data
-                        data["rows_data"][rowID] = row_data
-                        data["metadata"]["modified"] = datetime.now().isoformat()
-                        #data["metadata"]["rows_counter"] += 1
-
-                    elif action == 'u':
-                        rowID = input("Ingrese el ID de la fila a actualizar: ").strip()
-                        if rowID in data["rows_data"]:
-                            for cf in columnFamilies:
-                                if cf in data["rows_data"][rowID]:
-                                    print(f"Column Family: {cf}")
-                                    for prop in data["rows_data"][rowID][cf]:
-                                        value = input(f"Ingrese el nuevo valor para {prop} (actual: {list(data['rows_data'][rowID][cf][prop].values())}): ").strip()
-                                        timestamp = datetime.now().isoformat()
-                                        if prop in data["rows_data"][rowID][cf]:
-                                            #Limit the number of versions stored
-                                            if len(data["rows_data"][rowID][cf][prop]) >= versions:
-                                                oldest_timestamp = sorted(data["rows_data"][rowID][cf][prop])[0]
-                                                del data["rows_data"][rowID][cf][prop][oldest_timestamp]
-                                            data["rows_data"][rowID][cf][prop][timestamp] = value
-                                        else:
-                                            data["rows_data"][rowID][cf][prop] = {timestamp: value}
-                            data["metadata"]["modified"] = datetime.now().isoformat()
-                        else:
-                            console.print(f"ERROR: No se encontró la fila con ID {rowID}.", style=red)
-                    else:
-                        console.print(f"Acción no válida. Use 'i' para insertar o 'u' para actualizar.", style=red)
-                        return
+                os.remove(filePath)
+                self.blockCache.evictFile(filePath)
+                self._dropStore(filePath)
 
-                    #Guardar los cambios en el archivo JSON
-                    with open(filePath, 'w') as f_write:
-                        json.dump(data, f_write, indent=4)
-                    console.print(f"SISTEMA: Operación realizada en la tabla {tableName}.", style=blue)
-                    break
-        
-        if not found:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+        self._writeReplicationState(sequence)
+        return sequence
 
     """
-    Función para insertar multiples filas dentro de una tabla en HBase
-    * tableName: Nombre de la tabla
-    """
-    def insertMany(self, tablename):
-        try:
-            while True:
-                self.put(tableName=tableName, action='i')
-                console.print("\nCRTL+C para terminar de insertar\n", style=red)
-        except KeyboardInterrupt:
-            print("\nFin de inserción multiple")
-        except Exception as e:
-            return e
-        
-        """
-    Función para actualizar multiples filas dentro de una tabla en HBase
-    * tableName: Nombre de la tabla
-    """
-    def updateMany(self, tablename):
-        try:
-            while True:
-                self.put(tableName=tableName, action='u')
-                console.print("\nCRTL+C para terminar de actualizar\n", style=red)
-        except KeyboardInterrupt:
-            print("\nFin de actualización multiple")
-        except Exception as e:
-            return e
-        
-        
-    """
-    Función para obtener los datos de una fila en una tabla de HBase
-    * tableName: Nombre de la tabla
-    * rowID: ID de la fila a obtener
+    Función para aplicar un evento de celda sobre las filas de una tabla
+    * data: Contenido completo de la tabla
+    * event: Evento Put, DeleteColumn, DeleteFamily o DeleteRow
     """
-    def get(self, tableName, rowID):
-        foundTable = False
-        foundRow = False
-        
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    foundTable = True
-                    if rowID in data["rows_data"]:
-                        foundRow = True
-                        rowData = data["rows_data"][rowID]
-                        
-                        table = PrettyTable()
-                        headers = ["Row key"]
-                        row = [rowID]
-                        
-                        for cf, properties in rowData.items():
-                            for prop, values in properties.items():
-                                headers.append(f"{cf}:{prop}")
-                                latest_timestamp = max(values.keys())
-                                row.append(values[latest_timestamp])
-                        
-                        table.field_names = headers
-                        table.add_row(row)
-                        
-                        print(table)
-                        break
-        
-        if not foundTable:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
-        elif not foundRow:
-            console.print(f'ERROR: Fila con ID {rowID} no encontrada en la tabla {tableName}.', style=red)
+    def _applyCellEvent(self, data, event):
+        rows = data["rows_data"]
+        rowKey = event["row"]
 
+        if event["type"] == "Put":
+            cf, qualifier = event["column"].split(':', 1)
+            versions = rows.setdefault(rowKey, {}).setdefault(cf, {}).setdefault(qualifier, {})
+            versions[event["timestamp"]] = event["value"]
+            maxVersions = self._familySettings(data["metadata"], cf)["versions"]
+            for timestamp in sorted(versions)[:-maxVersions]:
+                del versions[timestamp]
+        elif event["type"] == "DeleteRow":
+            rows.pop(rowKey, None)
+        elif event["type"] == "DeleteFamily":
+            rows.get(rowKey, {}).pop(event["column"], None)
+        elif event["type"] == "DeleteColumn":
+            cf, qualifier = event["column"].split(':', 1)
+            cells = rows.get(rowKey, {}).get(cf)
+            if cells is not None:
+                cells.pop(qualifier, None)
+                if not cells:
+                    del rows[rowKey][cf]
+
+        data["metadata"]["modified"] = event["timestamp"]
 
     """
-    Función para escanear una tabla en HBase
-    * tableName: Nombre de la tabla a escanear
+    Función para aplicar un cambio de estructura de una tabla en la réplica
+    * event: Evento Create, Drop, Alter, Truncate, Enable, Disable, Clone o Restore
     """
-    def scan(self, tableName):
-        foundTable = False
-        
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    foundTable = True
-                    allRows = data["rows_data"]
-
-                    groupedRows = {}
-
-                    for rowID, rowData in allRows.items():
-                        #Obtener las propiedades de cada column family para agrupar las filas
-                        propertiesSignature = {}
-                        for cf, properties in rowData.items():
-                            propertiesSignature[cf] = tuple(sorted(properties.keys()))
-                        
-                        #Convertir el diccionario a una tupla para usarlo como clave
-                        propertiesSignature = tuple(sorted(propertiesSignature.items()))
-
-                        if propertiesSignature not in groupedRows:
-                            groupedRows[propertiesSignature] = []
-                        
-                        groupedRows[propertiesSignature].append((rowID, rowData))
-                    
-                    #Imprimir los grupos de filas
-                    for propertiesSignature, rows in groupedRows.items():
-                        #Crear tabla para las filas
-                        rowTable = PrettyTable()
-                        if rows:
-                            headers = ["Row key"]
-                            for cf, properties in rows[0][1].items():
-                                for prop in properties.keys():
-                                    headers.append(f"{cf}:{prop}")
-                            rowTable.field_names = headers
-
-                            for rowID, rowData in rows:
-                                row = [rowID]
-                                for cf, properties in rowData.items():
-                                    for prop, values in properties.items():
-                                        if values:
-                                            latestTimestamp = max(values.keys())
-                                            cellValue = f"{latestTimestamp}\n{values[latestTimestamp]}"
-                                        else:
-                                            cellValue = ""
-                                        row.append(cellValue)
-                                rowTable.add_row(row, divider=True)
-
-                        print(rowTable)
-                    break
-        
-        if not foundTable:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+    def _applyTableEvent(self, event):
+        tableName = event["table"]
+
+        if event["type"] == "Create":
+            filePath = os.path.join(self.directory, event["file_name"])
+            #Los store files del primario no existen en la réplica, se escriben los propios
+            metadata = json.loads(json.dumps(event["metadata"]))
+            metadata.pop("store_sequence", None)
+            for family in metadata.get("families", {}).values():
+                family.pop("store_file", None)
+            self._dropStore(filePath)
+            self._writeTable(filePath, {"metadata": metadata, "rows_data": {}})
+            return
+
+        if event["type"] in ("Clone", "Restore"):
+            #El contenido del snapshot se toma de la tabla del primario, enlazando sus archivos
+            sourcePath = os.path.join(self.primary, event["file_name"])
+            if os.path.exists(sourcePath):
+                self._copyTable(sourcePath, os.path.join(self.directory, event["file_name"]))
+            return
+
+        filePath, _ = self._findTable(tableName, cacheBlocks=False)
+        if filePath is None:
+            return
 
+        if event["type"] == "Drop":
+            os.remove(filePath)
+            self.blockCache.evictFile(filePath)
+            self._dropStore(filePath)
+            return
+
+        data = self._readTable(filePath, forUpdate=True)
+        metadata = data["metadata"]
+        metadata["modified"] = event["timestamp"]
+
+        if event["type"] == "Alter":
+            metadata["table_name"] = event["new_table_name"]
+            #Solo se agregan las familias que faltan, el evento puede aplicarse de nuevo tras el bootstrap
+            metadata["column_families"] += [cf for cf in event["new_column_families"] if cf not in metadata["column_families"]]
+            storage = event.get("storage")
+            converted = storage is not None and storage != metadata.get("storage", "row")
+            if converted:
+                data = self._convertStorage(filePath, data, storage)
+                metadata = data["metadata"]
+            for cf, settings in event["family_settings"].items():
+                metadata.setdefault("families", {}).setdefault(cf, {}).update(settings)
+            if event["family_settings"] and not converted:
+                data = self._loadRows(filePath, data, forUpdate=True)
+            if converted and storage == 'row':
+                self._writeTable(filePath, data)
+                self._dropStore(filePath)
+                return
+        elif event["type"] == "Truncate":
+            metadata["disabled"] = True
+            data["rows_data"] = {}
+        elif event["type"] in ("Enable", "Disable"):
+            metadata["disabled"] = event["type"] == "Disable"
+
+        self._writeTable(filePath, data)
 
     """
-    Función para eliminar una celda, una fila o una familia de columnas en una tabla de HBase
-    * tableName: Nombre de la tabla
+    Función para aplicar en la réplica un lote de eventos del registro de cambios del primario
+    * events: Eventos a aplicar, en orden de secuencia
     """
-    def delete(self, tableName, action):        
-        foundTable = False
-        
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    data["metadata"]["modified"] = datetime.now().isoformat()
-                    foundTable = True
-                    
-                    if action == 'c':
-                        rowKey = input("Ingrese la row key: ").strip()
-                        columnFamily = input("Ingrese la column family: ").strip()
-                        qualifier = input("Ingrese el qualifier: ").strip()
-                        
-                        if rowKey in data["rows_data"]:
-                            if columnFamily in data["rows_data"][rowKey]:
-                                if qualifier in data["rows_data"][rowKey][columnFamily]:
-                                    del data["rows_data"][rowKey][columnFamily][qualifier]
-                                    if not data["rows_data"][rowKey][columnFamily]:
-                                        del data["rows_data"][rowKey][columnFamily]
-                                    console.print(f'SISTEMA: Celda eliminada {rowKey} - {columnFamily}:{qualifier}', style=blue)
-                                else:
-                                    console.print(f'ERROR: No se encontró el qualifier {qualifier} en la column family {columnFamily}.', style=red)
-                            else:
-                                console.print(f'ERROR: No se encontró la column family {columnFamily} en la fila {rowKey}.', style=red)
-                        else:
-                            console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
-                    
-                    elif action == 'r':
-                        rowKey = input("Ingrese la row key: ").strip()
-                        
-                        if rowKey in data["rows_data"]:
-                            del data["rows_data"][rowKey]
-                            console.print(f'SISTEMA: Fila eliminada {rowKey}', style=blue)
-                        else:
-                            console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
-                    
-                    elif action == 'f':
-                        rowKey = input("Ingrese la row key: ").strip()
-                        columnFamily = input("Ingrese la column family: ").strip()
-                        
-                        if rowKey in data["rows_data"]:
-                            if columnFamily in data["rows_data"][rowKey]:
-                                del data["rows_data"][rowKey][columnFamily]
-                                console.print(f'SISTEMA: Column family eliminada {rowKey} - {columnFamily}', style=blue)
-                            else:
-                                console.print(f'ERROR: No se encontró la column family {columnFamily} en la fila {rowKey}.', style=red)
-                        else:
-                            console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
-                    
-                    else:
-                        print("Acción no válida. Use 'c' para eliminar una celda, 'r' para eliminar una fila o 'f' para eliminar una familia de columnas.")
-                    
-                    #Guardar los cambios en el archivo JSON
-                    with open(filePath, 'w') as f_write:
-                        json.dump(data, f_write, indent=4)
-                    break
-        
-        if not foundTable:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+    def _applyEvents(self, events):
+        #Los eventos de celda consecutivos de una tabla se aplican en memoria y la tabla se escribe una sola vez
+        pending = {}
+
+        def flush():
+            for filePath, data, applied in pending.values():
+                if filePath is not None:
+                    self._writeTable(filePath, data, self._eventFamilies(applied))
+            pending.clear()
+
+        for event in events:
+            tableName = event["table"]
+            if event["type"] in CELL_EVENTS:
+                if tableName not in pending:
+                    filePath, data = self._findTable(tableName, cacheBlocks=False)
+                    if filePath is not None:
+                        data = self._readTable(filePath, forUpdate=True)
+                        data = self._loadRows(filePath, data, forUpdate=True)
+                    pending[tableName] = (filePath, data, [])
+                if pending[tableName][0] is not None:
+                    self._applyCellEvent(pending[tableName][1], event)
+                    pending[tableName][2].append(event)
+            else:
+                flush()
+                self._applyTableEvent(event)
+
+        flush()
 
     """
-    Función para eliminar una fila en una tabla de HBase
-    * tableName: Nombre de la tabla
-    * rowKey: ID de la fila a eliminar
+    Función para aplicar en la réplica el siguiente lote de eventos del primario
+    * limit: Número máximo de eventos a aplicar
     """
-    def delete_all(self, tableName, rowKey):
-        foundTable = False
-        
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    data["metadata"]["modified"] = datetime.now().isoformat()
-                    foundTable = True
-                    
-                    if rowKey in data["rows_data"]:
-                        del data["rows_data"][rowKey]
-                        console.print(f'SISTEMA: Fila eliminada {rowKey}', style=blue)
-                        
-                        #Guardar los cambios en el archivo JSON
-                        with open(filePath, 'w') as f_write:
-                            json.dump(data, f_write, indent=4)
-                    else:
-                        console.print(f'ERROR: No se encontró la fila con row key {rowKey}.', style=red)
-                    break
-        
-        if not foundTable:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+    def replicate(self, limit=1000):
+        if self.primary is None:
+            console.print('ERROR: Esta instancia no es una réplica.', style=red)
+            return 0
+
+        with self.replicationLock:
+            if self.consumer is None:
+                state = self._readReplicationState()
+                #Se copia el primario completo si la réplica es nueva, sigue a otro primario o el registro del primario se reinició
+                if state is None or state["primary"] != os.path.abspath(self.primary) or state["applied_sequence"] > self.primaryLog.lastSequence():
+                    sequence = self._bootstrapReplica()
+                else:
+                    sequence = state["applied_sequence"]
+                self.consumer = ChangeLogConsumer(self.primaryLog, sequence)
+
+            events = self.consumer.poll(limit)
+            if events:
+                self._applyEvents(events)
+                self._writeReplicationState(self.consumer.sequence, events[-1]["timestamp"])
+            return len(events)
 
     """
-    Función para contar las filas de una tabla en HBase
-    * tableName: Nombre de la tabla
+    Función para iniciar la replicación asíncrona del primario en segundo plano
+    * interval: Segundos de espera cuando no hay eventos nuevos
     """
-    def count(self, tableName):
-        foundTable = False
-        
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    foundTable = True
-                    row_count = len(data["rows_data"])
-                    console.print(f'Cantidad de filas en la tabla {tableName}: {row_count}', style=green)
-                    break
-        
-        if not foundTable:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+    def startReplication(self, interval=0.5):
+        def replicate():
+            while True:
+                try:
+                    applied = self.replicate()
+                    self.replicationError = None
+                except Exception as e:
+                    #Un error no debe detener la replicación, el lote se vuelve a intentar
+                    self.replicationError = str(e)
+                    self.consumer = None
+                    applied = 0
+                if not applied:
+                    time.sleep(interval)
+
+        thread = threading.Thread(target=replicate, daemon=True)
+        thread.start()
+        return thread
 
     """
-    Función para truncar las filas de una tabla en HBase
-    * tableName: Nombre de la tabla
+    Función para mostrar el estado de la replicación y el retraso de la réplica respecto al primario
     """
-    def truncate(self, tableName):
-        foundTable = False
-        
-        for file in os.listdir(self.directory):
-            if file.endswith('.json'):
-                filePath = os.path.join(self.directory, file)
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                
-                if data["metadata"]["table_name"] == tableName:
-                    data["metadata"]["modified"] = datetime.now().isoformat()
-                    foundTable = True
-                    data["metadata"]["disabled"] = True
-                    console.print(f'SISTEMA: Tabla {tableName} ha sido deshabilitada.\n', style=blue)
-                    
-                    console.print('Eliminando todas las filas...', style=green)
-                    barColor = "\033[32m"
-                    for _ in tqdm(range(100), desc="Progreso", ncols=100, bar_format=f"{barColor}{{bar}}\033[00m"):
-                        time.sleep(0.03)  # Simulación de carga
-                    
-                    data["rows_data"] = {}
-                    data["metadata"]["rows_counter"] = 0
-                    
-                    with open(filePath, 'w') as f_write:
-                        json.dump(data, f_write, indent=4)
-                    
-                    console.print(f'\nSISTEMA: Todas las filas de la tabla {tableName} han sido eliminadas.', style=blue)
-                    break
-        
-        if not foundTable:
-            console.print(f'ERROR: Tabla {tableName} no encontrada.', style=red)
+    def replication_status(self):
+        if self.primary is None:
+            console.print('ERROR: Esta instancia no es una réplica.', style=red)
+            return
+
+        state = self._readReplicationState()
+        applied = state["applied_sequence"] if state else 0
+        primarySequence = self.primaryLog.lastSequence()
+
+        #El retraso en segundos es la antigüedad del evento más antiguo que aún no se aplica
+        lagSeconds = 0.0
+        for event in ChangeLogConsumer(self.primaryLog, applied).poll(1):
+            lagSeconds = max((datetime.now() - datetime.fromisoformat(event["timestamp"])).total_seconds(), 0.0)
 
+        table = PrettyTable()
+        table.field_names = ["Atributo", "Valor"]
+        table.add_row(["Primary", os.path.abspath(self.primary)])
+        table.add_row(["Replica", os.path.abspath(self.directory)])
+        table.add_row(["Applied Sequence", applied])
+        table.add_row(["Primary Sequence", primarySequence])
+        table.add_row(["Lag (events)", primarySequence - applied])
+        table.add_row(["Lag (seconds)", f"{lagSeconds:.3f}"])
+        table.add_row(["Last Applied Event", (state or {}).get("last_event_timestamp") or "N/A"])
+        table.add_row(["Last Error", self.replicationError or "N/A"])
+        print(table)
+
+        return {"applied_sequence": applied, "primary_sequence": primarySequence,
+                "lag_events": primarySequence - applied, "lag_seconds": lagSeconds}
+
+"""
+Función para pedir la configuración de cada column family
+* columnFamilies: Lista de column families a configurar
+"""
+def askFamilySettings(columnFamilies):
+    familySettings = {}
+    for cf in columnFamilies:
+        settings = {}
+        versions = input(f"Ingrese el número de versiones para {cf} (presione ENTER para omitir): ").strip()
+        if versions:
+            settings["versions"] = int(versions)
+        blockSize = input(f"Ingrese el tamaño de bloque en bytes para {cf} (presione ENTER para omitir): ").strip()
+        if blockSize:
+            settings["block_size"] = int(blockSize)
+        compression = input(f"Ingrese la compresión para {cf} ({', '.join(CODECS)}) (presione ENTER para omitir): ").strip().lower()
+        if compression:
+            settings["compression"] = compression
+        ttl = input(f"Ingrese el TTL en segundos para {cf}, 0 para no expirar (presione ENTER para omitir): ").strip()
+        if ttl:
+            settings["ttl"] = int(ttl) or None
+        if settings:
+            familySettings[cf] = settings
+    return familySettings
+
+"""
+Función para pedir las column families de una consulta
+"""
+def askFamilies():
+    families = input("Ingrese las column families a consultar separadas por comas (presione ENTER para todas): ").strip()
+    if not families:
+        return None
+    return [cf.strip() for cf in families.split(',')]
+
+"""
+Función para pedir la estrategia de row keys de una tabla nueva
+* columnFamilies: Column families de la tabla
+"""
+def askRowKey(columnFamilies):
+    rowKey = {}
+    strategy = input(f"Ingrese la estrategia de row keys ({', '.join(ROW_KEY_STRATEGIES)}) (presione ENTER para uuid): ").strip().lower() or "uuid"
+    rowKey["strategy"] = strategy
+    if strategy == "composite":
+        columns = input(f"Ingrese las columnas family:qualifier que forman la row key separadas por comas ({', '.join(columnFamilies)}): ").strip()
+        rowKey["columns"] = [column.strip() for column in columns.split(',') if column.strip()]
+    buckets = input("Ingrese el número de buckets de sal (presione ENTER para omitir): ").strip()
+    if buckets and int(buckets) > 1:
+        rowKey["salt_buckets"] = int(buckets)
+    return rowKey
+
+"""
+Función para pedir el rango de row keys de una consulta, por prefijo o por row key inicial y final
+"""
+def askRowRange():
+    prefix = input("Ingrese el prefijo de las row keys (presione ENTER para omitir): ").strip()
+    if prefix:
+        return prefixRange(prefix)
+    startRow = input("Ingrese la row key inicial (presione ENTER para omitir): ").strip() or None
+    stopRow = input("Ingrese la row key final, no incluida (presione ENTER para omitir): ").strip() or None
+    return startRow, stopRow
+
+"""
+Función para convertir los argumentos escritos en la consola a números cuando sea posible
+* args: Texto con los argumentos separados por comas
+"""
+def parseArguments(args):
+    parsed = []
+    for arg in [arg.strip() for arg in args.split(',') if arg.strip()]:
+        try:
+            parsed.append(json.loads(arg))
+        except ValueError:
+            parsed.append(arg)
+    return parsed
 
 """
 Función para imprime los comandos disponibles
@@ -667,11 +2345,26 @@ def printComands():
     table.add_row(["insert_many", "Insertación de multiples filas"])
     table.add_row(["update_many", "Actualización de multiples filas"])
     table.add_row(["get", "Obtener datos de una fila"])
-    table.add_row(["scan", "Escanear una tabla"])
+    table.add_row(["multi_get", "Obtener datos de varias filas"])
+    table.add_row(["scan", "Escanear una tabla, completa o por rango/prefijo de row keys"])
+    table.add_row(["next", "Mostrar la siguiente página del último scan"])
     table.add_row(["delete", "Eliminar una celda, fila o column family de una tabla"])
     table.add_row(["delete_all", "Eliminar una fila de una tabla"])
-    table.add_row(["count", "Contar filas de una tabla"])
+    table.add_row(["count", "Contar filas de una tabla, completa o por rango/prefijo de row keys"])
+    table.add_row(["aggregate", "Calcular count/sum/avg/min/max de una columna, con group by opcional"])
     table.add_row(["truncate", "Truncar filas de una tabla"])
+    table.add_row(["major_compact", "Eliminar las celdas expiradas por TTL de una tabla"])
+    table.add_row(["changes", "Consultar el registro de cambios desde un número de secuencia"])
+    table.add_row(["snapshot", "Tomar un snapshot de una tabla"])
+    table.add_row(["list_snapshots", "Listar los snapshots"])
+    table.add_row(["clone_snapshot", "Crear una tabla nueva a partir de un snapshot"])
+    table.add_row(["restore_snapshot", "Restaurar una tabla a un snapshot"])
+    table.add_row(["delete_snapshot", "Eliminar un snapshot"])
+    table.add_row(["add_coprocessor", "Registrar un observer (module:Class) en una tabla"])
+    table.add_row(["remove_coprocessors", "Quitar los observers de una tabla"])
+    table.add_row(["endpoint", "Ejecutar un endpoint sobre las filas de una tabla y mostrar solo el resultado"])
+    table.add_row(["follow", "Convertir esta sesión en una réplica de solo lectura de otro directorio"])
+    table.add_row(["replication_status", "Mostrar el retraso de la réplica respecto al primario"])
     table.add_row(["help", "Imprimir los comandos disponibles"])
     table.add_row(["exit", "Salir del programa"])
 
@@ -680,6 +2373,7 @@ def printComands():
 #Ejecución del programa
 if __name__ == '__main__':
     hbase = HBase()
+    hbase.startPurgeThread()
 
     #Imprimir bienvenida
     asciiHBase = pyfiglet.figlet_format("HBase Simulator")
@@ -697,8 +2391,12 @@ if __name__ == '__main__':
                 columnFamilies = input("Ingrese las column families separadas por comas: ").strip().split(',')
                 columnFamilies = [cf.strip() for cf in columnFamilies]
                 versions = int(input("Ingrese el número máximo de versiones de celda que se almacenarán: ").strip())
+                columnar = input("¿Desea guardar cada column family en sus propios store files? (s/n): ").strip().lower()
+                storage = 'columnar' if columnar == 's' else 'row'
+                familySettings = askFamilySettings(columnFamilies)
+                rowKey = askRowKey(columnFamilies)
                 fileName = tableName + ".json"
-                hbase.create(fileName, tableName, columnFamilies, versions)
+                hbase.create(fileName, tableName, columnFamilies, versions, storage, familySettings, rowKey)
             
             except Exception as e:
                 print()
@@ -744,8 +2442,14 @@ if __name__ == '__main__':
                 newTableName = input("Ingrese el nuevo nombre de la tabla: ").strip()
                 newColumnFamilies = input("Ingrese las column families a agregar separadas por comas (presione ENTER para omitir): ").strip().split(',')
                 newColumnFamilies = [cf.strip() for cf in newColumnFamilies]
+                familySettings = {}
+                changeSettings = input("¿Desea modificar la configuración de alguna column family? (s/n): ").strip().lower()
+                if changeSettings == 's':
+                    families = input("Ingrese las column families a modificar separadas por comas: ").strip().split(',')
+                    familySettings = askFamilySettings([cf.strip() for cf in families])
+                storage = input("Ingrese el nuevo almacenamiento de la tabla, 'row' o 'columnar' (presione ENTER para omitir): ").strip().lower() or None
                 
-                hbase.alter(oldTableName, newTableName, newColumnFamilies)
+                hbase.alter(oldTableName, newTableName, newColumnFamilies, familySettings, storage)
             
             except Exception as e:
                 print()
@@ -809,21 +2513,45 @@ if __name__ == '__main__':
             try:
                 tableName = input("Ingrese el nombre de la tabla: ").strip()
                 rowID = input("Ingrese el ID de la fila: ").strip()
-                hbase.get(tableName, rowID)
+                families = askFamilies()
+                hbase.get(tableName, rowID, families)
             
             except Exception as e:
                 print()
                 console.print(f"ERROR: No fue posible obtener la fila: {e}", style=red)
 
+        elif command == 'multi_get':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                rowKeys = [rowKey.strip() for rowKey in input("Ingrese los IDs de las filas separados por comas: ").strip().split(',')]
+                columns = input("Ingrese las column families o columnas family:qualifier separadas por comas (presione ENTER para todas): ").strip()
+                columns = [column.strip() for column in columns.split(',')] if columns else None
+                hbase.multiGet(tableName, rowKeys, columns)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible obtener las filas: {e}", style=red)
+
         elif command == 'scan':
             try:
                 tableName = input("Ingrese el nombre de la tabla: ").strip()
-                hbase.scan(tableName)
+                families = askFamilies()
+                startRow, stopRow = askRowRange()
+                skipCache = input("¿Omitir la caché de bloques en este scan? (s/n): ").strip().lower()
+                pageSize = input(f"Ingrese el número de filas por página (presione ENTER para {DEFAULT_PAGE_SIZE}): ").strip()
+                hbase.scan(tableName, cacheBlocks=(skipCache != 's'), families=families, startRow=startRow, stopRow=stopRow, pageSize=int(pageSize or DEFAULT_PAGE_SIZE))
             
             except Exception as e:
                 print()
                 console.print(f"ERROR: No fue posible escanear la tabla: {e}", style=red)
 
+        elif command == 'next':
+            try:
+                hbase.nextPage()
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible obtener la siguiente página: {e}", style=red)
+
         elif command == 'delete':
             try:
                 tableName = input("Ingrese el nombre de la tabla: ").strip()
@@ -847,12 +2575,27 @@ if __name__ == '__main__':
         elif command == 'count':
             try:
                 tableName = input("Ingrese el nombre de la tabla: ").strip()
-                hbase.count(tableName)
+                startRow, stopRow = askRowRange()
+                hbase.count(tableName, startRow, stopRow)
             
             except Exception as e:
                 print()
                 console.print(f"ERROR: No fue posible contar la filas de la tabla: {e}", style=red)
         
+        elif command == 'aggregate':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                column = input("Ingrese la columna a agregar (family:qualifier): ").strip()
+                functions = input(f"Ingrese las agregaciones separadas por comas ({', '.join(AGGREGATIONS)}) (presione ENTER para todas): ").strip()
+                functions = [function.strip().lower() for function in functions.split(',')] if functions else None
+                groupBy = input("Ingrese la columna para agrupar (family:qualifier) (presione ENTER para omitir): ").strip() or None
+                startRow, stopRow = askRowRange()
+                hbase.aggregate(tableName, column, functions, groupBy, startRow, stopRow)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible calcular la agregación: {e}", style=red)
+
         elif command == 'truncate':
             try:
                 tableName = input("Ingrese el nombre de la tabla: ").strip()
@@ -862,6 +2605,121 @@ if __name__ == '__main__':
                 print()
                 console.print(f"ERROR: No fue posible truncar la tabla: {e}", style=red)
 
+        elif command == 'major_compact':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                hbase.major_compact(tableName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible compactar la tabla: {e}", style=red)
+
+        elif command == 'changes':
+            try:
+                fromSequence = input("Ingrese el último número de secuencia leído (presione ENTER para 0): ").strip()
+                tableName = input("Ingrese el nombre de la tabla (presione ENTER para todas): ").strip() or None
+                hbase.changes(int(fromSequence or 0), tableName=tableName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible consultar el registro de cambios: {e}", style=red)
+
+        elif command == 'snapshot':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                snapshotName = input("Ingrese el nombre del snapshot: ").strip()
+                hbase.snapshot(tableName, snapshotName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible tomar el snapshot: {e}", style=red)
+
+        elif command == 'list_snapshots':
+            try:
+                hbase.list_snapshots()
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible listar los snapshots: {e}", style=red)
+
+        elif command == 'clone_snapshot':
+            try:
+                snapshotName = input("Ingrese el nombre del snapshot: ").strip()
+                newTableName = input("Ingrese el nombre de la tabla nueva: ").strip()
+                hbase.clone_snapshot(snapshotName, newTableName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible clonar el snapshot: {e}", style=red)
+
+        elif command == 'restore_snapshot':
+            try:
+                snapshotName = input("Ingrese el nombre del snapshot: ").strip()
+                hbase.restore_snapshot(snapshotName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible restaurar el snapshot: {e}", style=red)
+
+        elif command == 'delete_snapshot':
+            try:
+                snapshotName = input("Ingrese el nombre del snapshot: ").strip()
+                hbase.delete_snapshot(snapshotName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible eliminar el snapshot: {e}", style=red)
+
+        elif command == 'add_coprocessor':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                classPath = input("Ingrese el observer con formato module:Class (p. ej. Coprocessor:CapacityValidator): ").strip()
+                args = parseArguments(input("Ingrese los argumentos del observer separados por comas (presione ENTER para omitir): "))
+                hbase.addCoprocessor(tableName, loadObserver(classPath, *args))
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible registrar el coprocesador: {e}", style=red)
+
+        elif command == 'remove_coprocessors':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                hbase.removeCoprocessors(tableName)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible quitar los coprocesadores: {e}", style=red)
+
+        elif command == 'endpoint':
+            try:
+                tableName = input("Ingrese el nombre de la tabla: ").strip()
+                endpointName = input(f"Ingrese el endpoint ({', '.join(hbase.endpoints)}): ").strip()
+                args = parseArguments(input("Ingrese los argumentos del endpoint separados por comas, p. ej. family:qualifier (presione ENTER para omitir): "))
+                startRow, stopRow = askRowRange()
+                hbase.execEndpoint(tableName, endpointName, *args, startRow=startRow, stopRow=stopRow)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible ejecutar el endpoint: {e}", style=red)
+
+        elif command == 'follow':
+            try:
+                primary = input("Ingrese el directorio del HBase primario (presione ENTER para tables): ").strip() or 'tables'
+                directory = input("Ingrese el directorio de la réplica: ").strip()
+                hbase = HBase(directory=directory, primary=primary)
+                hbase.startReplication()
+                console.print(f'SISTEMA: Replicando {primary} en {directory}. Esta sesión solo permite lecturas.', style=blue)
+            
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible iniciar la replicación: {e}", style=red)
+
+        elif command == 'replication_status':
+            try:
+                hbase.replication_status()
+            except Exception as e:
+                print()
+                console.print(f"ERROR: No fue posible consultar el estado de la replicación: {e}", style=red)
+
         elif command == 'help':
             printComands()
         
@@ -0,0 +1,133 @@
+'''
+ * Nombre: RowKeys.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Estrategias para generar row keys ordenadas por tiempo, compuestas por columnas o con prefijo de sal.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+import os
+import time
+import uuid
+import zlib
+import threading
+
+#Estrategias disponibles para generar las row keys de una tabla
+ROW_KEY_STRATEGIES = ["uuid", "time", "composite"]
+
+#Alfabeto base32 de Crockford, su orden ASCII coincide con el orden numérico
+CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+#Separadores de los valores de una llave compuesta y del prefijo de sal
+COMPOSITE_SEPARATOR = '#'
+SALT_SEPARATOR = '-'
+
+#Último milisegundo y parte aleatoria generados, mantienen las llaves crecientes dentro del mismo milisegundo
+_lastTime = 0
+_lastRandom = 0
+_lock = threading.Lock()
+
+"""
+Función para generar una row key ordenada por tiempo con formato ULID (26 caracteres)
+"""
+def timeOrderedKey():
+    global _lastTime, _lastRandom
+    with _lock:
+        now = time.time_ns() // 1000000
+        if now <= _lastTime:
+            now = _lastTime
+            _lastRandom += 1
+        else:
+            _lastRandom = int.from_bytes(os.urandom(10), 'big')
+        _lastTime = now
+
+        #48 bits de milisegundos seguidos de 80 bits aleatorios
+        value = (now << 80) | (_lastRandom & ((1 << 80) - 1))
+
+    chars = []
+    for _ in range(26):
+        chars.append(CROCKFORD[value & 31])
+        value >>= 5
+    return ''.join(reversed(chars))
+
+"""
+Función para generar una row key compuesta por los valores de algunas columnas
+* columns: Columnas family:qualifier que forman el prefijo de la llave, en orden
+* rowData: Datos de la fila a insertar
+"""
+def compositeKey(columns, rowData):
+    values = []
+    for column in columns:
+        cf, qualifier = column.split(':', 1)
+        versions = rowData.get(cf, {}).get(qualifier)
+        values.append(versions[max(versions)] if versions else '')
+
+    #El sufijo ordenado por tiempo distingue las filas con los mismos valores
+    return COMPOSITE_SEPARATOR.join(values + [timeOrderedKey()])
+
+"""
+Función para agregar a una row key el prefijo de sal de su bucket
+* rowKey: Row key original
+* buckets: Número de buckets de sal
+"""
+def saltKey(rowKey, buckets):
+    return f"{saltPrefix(zlib.crc32(rowKey.encode('utf-8')) % buckets, buckets)}{rowKey}"
+
+"""
+Función para obtener el prefijo de sal de un bucket
+* bucket: Número del bucket
+* buckets: Número de buckets de sal
+"""
+def saltPrefix(bucket, buckets):
+    return f"{bucket:0{len(str(buckets - 1))}d}{SALT_SEPARATOR}"
+
+"""
+Función para generar la row key de una fila nueva según la estrategia de la tabla
+* rowKeySettings: Estrategia de row keys, p. ej. {"strategy": "composite", "columns": ["classrooms:identifier"], "salt_buckets": 4}
+* rowData: Datos de la fila a insertar
+"""
+def makeRowKey(rowKeySettings, rowData):
+    rowKeySettings = rowKeySettings or {}
+    strategy = rowKeySettings.get("strategy", "uuid")
+
+    if strategy == "time":
+        rowKey = timeOrderedKey()
+    elif strategy == "composite":
+        rowKey = compositeKey(rowKeySettings["columns"], rowData)
+    else:
+        rowKey = str(uuid.uuid4())
+
+    if rowKeySettings.get("salt_buckets"):
+        rowKey = saltKey(rowKey, rowKeySettings["salt_buckets"])
+    return rowKey
+
+"""
+Función para obtener el rango de row keys que empiezan con un prefijo
+* prefix: Prefijo de las row keys
+"""
+def prefixRange(prefix):
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+"""
+Función para traducir un rango de row keys sin sal a los rangos que se leen en cada bucket
+* rowKeySettings: Estrategia de row keys de la tabla
+* startRow: Primera row key incluida, sin prefijo de sal (opcional)
+* stopRow: Row key donde se detiene la lectura, no incluida, sin prefijo de sal (opcional)
+"""
+def keyRanges(rowKeySettings, startRow=None, stopRow=None):
+    buckets = (rowKeySettings or {}).get("salt_buckets")
+    if not buckets or (startRow is None and stopRow is None):
+        return [(startRow, stopRow)]
+
+    ranges = []
+    for bucket in range(buckets):
+        prefix = saltPrefix(bucket, buckets)
+        start = prefix + (startRow or '')
+        stop = prefix + stopRow if stopRow is not None else prefixRange(prefix)[1]
+        ranges.append((start, stop))
+    return ranges
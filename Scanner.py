@@ -0,0 +1,75 @@
+'''
+ * Nombre: Scanner.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Cursor de un scan que entrega las filas por páginas sin leer la tabla completa.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+from itertools import islice
+
+#Número de filas por página por defecto
+DEFAULT_PAGE_SIZE = 50
+
+class Scanner:
+    """
+    Constructor del cursor de un scan
+    * tableName: Nombre de la tabla escaneada
+    * rows: Iterador de (rowKey, datos de la fila) en orden
+    * readers: Store files abiertos por el scan, se cierran al terminar
+    * pageSize: Número de filas por página
+    * readPoint: Número de secuencia de la versión de la tabla que lee el cursor
+    """
+    def __init__(self, tableName, rows, readers=None, pageSize=DEFAULT_PAGE_SIZE, readPoint=0):
+        #Con páginas vacías el cursor nunca terminaría
+        if pageSize < 1:
+            raise ValueError("El número de filas por página debe ser mayor que 0")
+        self.tableName = tableName
+        self.rows = rows
+        self.readers = readers or []
+        self.pageSize = pageSize
+        self.readPoint = readPoint
+        self.rowsRead = 0
+        self.exhausted = False
+
+        #Encabezados de cada grupo de filas, se calculan una sola vez por firma de propiedades
+        self.headers = {}
+
+    """
+    Función para obtener la siguiente página de filas
+    """
+    def nextPage(self):
+        if self.exhausted:
+            return {}
+
+        page = dict(islice(self.rows, self.pageSize))
+        self.rowsRead += len(page)
+        if len(page) < self.pageSize:
+            self.close()
+        return page
+
+    """
+    Función para obtener los encabezados de una fila, reutilizando los de su grupo
+    * rowData: Datos de la fila
+    """
+    def headersFor(self, rowData):
+        signature = tuple((cf, tuple(properties)) for cf, properties in rowData.items())
+        headers = self.headers.get(signature)
+        if headers is None:
+            headers = ["Row key"] + [f"{cf}:{prop}" for cf, properties in rowData.items() for prop in properties]
+            self.headers[signature] = headers
+        return signature, headers
+
+    """
+    Función para cerrar el cursor y los store files que mantiene abiertos
+    """
+    def close(self):
+        self.exhausted = True
+        for reader in self.readers:
+            reader.close()
+        self.readers = []
@@ -0,0 +1,254 @@
+'''
+ * Nombre: StoreFile.py
+ * Autores:
+    - Fernanda Esquivel, 21542
+    - Adrian Fulladolsa, 21592
+    - Elías Alvarado, 21808
+ * Descripción: Archivos inmutables por column family, divididos en bloques ordenados por row key.
+ * Lenguaje: Python
+ * Recursos: VSCode, JSON
+ * Historial:
+    - Creado el 19.10.2026
+'''
+
+import json
+import os
+import struct
+import zlib
+import bz2
+import lzma
+from bisect import bisect_right
+from BlockCache import decodedSize
+
+#Formato del archivo: [bloque 0][bloque 1]...[índice JSON][footer]
+#El footer guarda el offset del índice y un número mágico para validar el archivo
+MAGIC = b'HSTORE01'
+FOOTER = struct.Struct('>Q8s')
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+#Codecs disponibles para comprimir los bloques: nombre -> (comprimir, descomprimir)
+CODECS = {
+    "none": (bytes, bytes),
+    "zlib": (zlib.compress, zlib.decompress),
+    "bz2": (bz2.compress, bz2.decompress),
+    "lzma": (lzma.compress, lzma.decompress)
+}
+
+"""
+Función para descartar las versiones de celdas anteriores a un timestamp
+* cells: Diccionario qualifier -> {timestamp: valor}
+* cutoff: Timestamp ISO más antiguo que se conserva
+"""
+def dropExpired(cells, cutoff):
+    live = {}
+    for qualifier, versions in cells.items():
+        liveVersions = {timestamp: value for timestamp, value in versions.items() if timestamp >= cutoff}
+        if liveVersions:
+            live[qualifier] = liveVersions
+    return live
+
+"""
+Función para escribir un store file con las filas de una column family
+* filePath: Ruta del store file a crear
+* rows: Diccionario rowKey -> {qualifier: {timestamp: valor}}
+* blockSize: Tamaño aproximado en bytes de cada bloque antes de comprimir
+* compression: Codec con el que se comprime cada bloque (ver CODECS)
+"""
+def writeStoreFile(filePath, rows, blockSize=DEFAULT_BLOCK_SIZE, compression="none"):
+    compress = CODECS[compression][0]
+    index = []
+    offset = 0
+
+    #Los store files nunca se sobrescriben, un archivo existente produce FileExistsError
+    with open(filePath, 'xb') as f:
+        block = []
+        blockBytes = 0
+
+        #Las filas se guardan ordenadas para poder buscar bloques por row key
+        for rowKey in sorted(rows):
+            encodedRow = json.dumps([rowKey, rows[rowKey]], separators=(',', ':'))
+            if not block:
+                index.append([rowKey, offset, 0, 0, None, None])
+            block.append(encodedRow)
+            blockBytes += len(encodedRow)
+
+            #Timestamps mínimo y máximo del bloque, permiten saltar bloques expirados sin decodificarlos
+            entry = index[-1]
+            for versions in rows[rowKey].values():
+                for timestamp in versions:
+                    if entry[4] is None or timestamp < entry[4]:
+                        entry[4] = timestamp
+                    if entry[5] is None or timestamp > entry[5]:
+                        entry[5] = timestamp
+
+            if blockBytes >= blockSize:
+                offset = _writeBlock(f, block, index, offset, compress)
+                block = []
+                blockBytes = 0
+
+        if block:
+            offset = _writeBlock(f, block, index, offset, compress)
+
+        trailer = json.dumps({"index": index, "rows": len(rows), "compression": compression}).encode('utf-8')
+        f.write(trailer)
+        f.write(FOOTER.pack(offset, MAGIC))
+
+#Escribe un bloque de filas ya codificadas y completa en el índice su longitud comprimida y original
+def _writeBlock(f, block, index, offset, compress):
+    encoded = ('[' + ','.join(block) + ']').encode('utf-8')
+    compressed = compress(encoded)
+    f.write(compressed)
+    index[-1][2] = len(compressed)
+    index[-1][3] = len(encoded)
+    return offset + len(compressed)
+
+class StoreFileReader:
+    """
+    Constructor del lector de store files
+    * filePath: Ruta del store file
+    * blockCache: Caché de bloques compartida (opcional)
+    * tableName: Nombre de la tabla, usado para las estadísticas de la caché
+    """
+    def __init__(self, filePath, blockCache=None, tableName=None):
+        self.filePath = filePath
+        self.blockCache = blockCache
+        self.tableName = tableName
+        self.file = open(filePath, 'rb')
+
+        #Sello del archivo abierto, evita usar bloques en caché de un archivo anterior con la misma ruta
+        stat = os.fstat(self.file.fileno())
+        self.stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        self.file.seek(-FOOTER.size, 2)
+        trailerOffset, magic = FOOTER.unpack(self.file.read(FOOTER.size))
+        if magic != MAGIC:
+            self.file.close()
+            raise ValueError(f"{filePath} no es un store file válido")
+
+        end = self.file.seek(-FOOTER.size, 2)
+        self.file.seek(trailerOffset)
+        trailer = json.loads(self.file.read(end - trailerOffset))
+        self.index = trailer["index"]
+        self.rowCount = trailer["rows"]
+        self.compression = trailer.get("compression", "none")
+        self.decompress = CODECS[self.compression][1]
+        self.firstKeys = [entry[0] for entry in self.index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Función para cerrar el store file
+    """
+    def close(self):
+        self.file.close()
+
+    """
+    Función para obtener los bytes originales y los bytes guardados de todos los bloques
+    """
+    def sizes(self):
+        storedBytes = sum(entry[2] for entry in self.index)
+        rawBytes = sum(entry[3] for entry in self.index)
+        return rawBytes, storedBytes
+
+    """
+    Función para leer y decodificar un bloque, usando la caché de bloques si existe
+    * blockNumber: Posición del bloque en el índice
+    * cacheBlocks: False para no guardar el bloque en la caché
+    El bloque devuelto puede estar compartido por la caché y no debe modificarse
+    """
+    def readBlock(self, blockNumber, cacheBlocks=True):
+        _, offset, length = self.index[blockNumber][:3]
+        key = (self.filePath, offset)
+
+        if self.blockCache is not None:
+            block = self.blockCache.getBlock(key, self.stamp)
+            if block is not None:
+                self.blockCache.recordAccess(self.tableName, True)
+                return block
+
+        self.file.seek(offset)
+        block = dict(json.loads(self.decompress(self.file.read(length))))
+
+        if self.blockCache is not None:
+            self.blockCache.recordAccess(self.tableName, False)
+            if cacheBlocks:
+                #La caché se cobra por el tamaño decodificado, no por los bytes del bloque en disco
+                self.blockCache.cacheBlock(key, self.stamp, block, decodedSize(block))
+        return block
+
+    """
+    Función para obtener las celdas de una fila
+    * rowKey: Row key a buscar
+    * cacheBlocks: False para no guardar el bloque en la caché
+    """
+    def getRow(self, rowKey, cacheBlocks=True):
+        for _, cells in self.getRows([rowKey], cacheBlocks):
+            return cells
+        return None
+
+    """
+    Función para verificar si un bloque solo tiene celdas anteriores a un timestamp
+    * blockNumber: Posición del bloque en el índice
+    * minTimestamp: Timestamp ISO más antiguo que se conserva (None para no descartar)
+    """
+    def _blockExpired(self, blockNumber, minTimestamp):
+        maxTimestamp = self.index[blockNumber][5]
+        return minTimestamp is not None and (maxTimestamp is None or maxTimestamp < minTimestamp)
+
+    #Descarta de una fila las versiones expiradas, solo si el bloque tiene alguna
+    def _liveCells(self, blockNumber, cells, minTimestamp):
+        if minTimestamp is None or self.index[blockNumber][4] >= minTimestamp:
+            return cells
+        return dropExpired(cells, minTimestamp)
+
+    """
+    Función para obtener varias filas en una sola pasada, leyendo cada bloque una vez
+    * rowKeys: Row keys a buscar, ordenadas
+    * cacheBlocks: False para no guardar los bloques en la caché
+    * minTimestamp: Timestamp ISO más antiguo que se conserva (None para no descartar)
+    """
+    def getRows(self, rowKeys, cacheBlocks=True, minTimestamp=None):
+        currentBlock = -1
+        block = None
+        for rowKey in rowKeys:
+            blockNumber = bisect_right(self.firstKeys, rowKey) - 1
+            if blockNumber < 0 or self._blockExpired(blockNumber, minTimestamp):
+                continue
+            if blockNumber != currentBlock:
+                currentBlock = blockNumber
+                block = self.readBlock(blockNumber, cacheBlocks)
+            cells = block.get(rowKey)
+            if cells is not None:
+                cells = self._liveCells(blockNumber, cells, minTimestamp)
+            if cells:
+                yield rowKey, cells
+
+    """
+    Función para recorrer en orden las filas del store file
+    * startRow: Primera row key incluida (opcional)
+    * stopRow: Row key donde se detiene el recorrido, no incluida (opcional)
+    * cacheBlocks: False para no guardar los bloques en la caché
+    * minTimestamp: Timestamp ISO más antiguo que se conserva (None para no descartar)
+    """
+    def scan(self, startRow=None, stopRow=None, cacheBlocks=True, minTimestamp=None):
+        firstBlock = 0
+        if startRow is not None:
+            firstBlock = max(bisect_right(self.firstKeys, startRow) - 1, 0)
+
+        for blockNumber in range(firstBlock, len(self.index)):
+            if stopRow is not None and self.firstKeys[blockNumber] >= stopRow:
+                return
+            if self._blockExpired(blockNumber, minTimestamp):
+                continue
+            for rowKey, cells in self.readBlock(blockNumber, cacheBlocks).items():
+                if startRow is not None and rowKey < startRow:
+                    continue
+                if stopRow is not None and rowKey >= stopRow:
+                    return
+                cells = self._liveCells(blockNumber, cells, minTimestamp)
+                if cells:
+                    yield rowKey, cells